@@ -0,0 +1,228 @@
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import numpy as np
+import pygame
+from engine.headless import init_display
+from engine.canvas import Canvas, DirtyCanvas, TextureCanvas
+from engine.batch import SpriteBatch
+from engine.input import ScriptedInput
+from engine.bots import BOTS
+from engine.timestep import TICK_RATE
+
+W, H = 600, 800
+DT = 1 / TICK_RATE
+STORE_PHASES = {"any_hit": "collision", "kill_hit": "collision", "kill_below": "cull"}
+
+def summarize(samples):
+    ms = np.asarray(samples) * 1000.0
+    return {
+        "mean_ms": round(float(ms.mean()), 4),
+        "p95_ms": round(float(np.percentile(ms, 95)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+    }
+
+def advance_to_level(scene, level):
+    while scene.level < level:
+        scene.elapsed = scene._next_level_at
+        scene.update(0.0)
+
+def top_up(manager, n, spread = False):
+    k = n - len(manager.potatoes)
+    if k <= 0:
+        return
+    xs = np.random.randint(25, manager.W - 25 + 1, k)
+    speeds = np.random.uniform(*manager.speed_range, k)
+    ys = np.random.uniform(-60, manager.H - 40, k) if spread else -60.0
+    manager.potatoes.add_many(xs, speeds, ys)
+
+def saturate(manager):
+    top_up(manager, manager.max_count, spread = True)
+
+def time_calls(obj, phases, names):
+    for attr, phase in names.items():
+        def timed(*args, fn = getattr(obj, attr), samples = phases[phase]):
+            t = time.perf_counter()
+            result = fn(*args)
+            samples[-1] += time.perf_counter() - t
+            return result
+        setattr(obj, attr, timed)
+
+def bench_menu(canvas, frames):
+    from scenes.menu import MainMenuScene
+    scene = MainMenuScene(W, H)
+    phases = {"update": [], "draw": [], "present": []}
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        scene.update(DT)
+        t1 = time.perf_counter()
+        scene.draw(canvas)
+        t2 = time.perf_counter()
+        canvas.present()
+        t3 = time.perf_counter()
+        phases["update"].append(t1 - t0)
+        phases["draw"].append(t2 - t1)
+        phases["present"].append(t3 - t2)
+    return phases
+
+def bench_scene(canvas, name, frames, level = 1, saturated = False):
+    from main import SCENES
+    bot = BOTS[name]()
+    source = ScriptedInput()
+    scene = SCENES[name](W, H, input_source = source)
+
+    def prepare():
+        advance_to_level(scene, level)
+        if saturated:
+            saturate(scene.manager)
+
+    prepare()
+    canvas.invalidate()
+    phases = {"update": [], "collision": [], "cull": [], "draw": [], "present": []}
+    time_calls(scene.manager.potatoes, phases, STORE_PHASES)
+    for _ in range(frames):
+        if scene.game_over:
+            scene.reset()
+            prepare()
+            canvas.invalidate()
+        source.set(bot(scene))
+        phases["collision"].append(0.0)
+        phases["cull"].append(0.0)
+        t0 = time.perf_counter()
+        scene.update(DT)
+        t1 = time.perf_counter()
+        if not scene.game_over:
+            scene.draw(canvas)
+        t2 = time.perf_counter()
+        canvas.present()
+        t3 = time.perf_counter()
+        phases["update"].append(t1 - t0 - phases["collision"][-1] - phases["cull"][-1])
+        phases["draw"].append(t2 - t1)
+        phases["present"].append(t3 - t2)
+    return phases
+
+def bench_manager(canvas, n, frames):
+    from scenes.dodge import PotatoManager
+    image = pygame.Surface((30, 23), pygame.SRCALPHA).convert_alpha()
+    manager = PotatoManager(image, W, H, spawn_interval = float("inf"), max_count = n)
+    probe = pygame.Rect(W // 2 - 22, H // 2 + 235, 45, 70)
+    batch = SpriteBatch()
+    saturate(manager)
+
+    phases = {"update": [], "collision": [], "cull": [], "draw": []}
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        manager.step(DT)
+        t1 = time.perf_counter()
+        manager.collide_with(probe)
+        t2 = time.perf_counter()
+        manager.cull_out_and_count()
+        t3 = time.perf_counter()
+        manager.draw(batch)
+        batch.flush(canvas)
+        t4 = time.perf_counter()
+        phases["update"].append(t1 - t0)
+        phases["collision"].append(t2 - t1)
+        phases["cull"].append(t3 - t2)
+        phases["draw"].append(t4 - t3)
+        top_up(manager, n)
+    return phases
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text = True, stderr = subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(frames, counts, dirty = False, texture = False):
+    screen = init_display(W, H)
+    if texture:
+        canvas = TextureCanvas((W, H))
+    else:
+        canvas = DirtyCanvas(screen) if dirty else Canvas(screen)
+    scenarios = [
+        ("menu_idle", None, lambda: bench_menu(canvas, frames)),
+        ("dodge_lv1", None, lambda: bench_scene(canvas, "dodge", frames)),
+        ("dodge_lv10", None, lambda: bench_scene(canvas, "dodge", frames, level = 10)),
+        ("dodge_saturated", None, lambda: bench_scene(canvas, "dodge", frames, level = 10, saturated = True)),
+        ("catch_lv1", None, lambda: bench_scene(canvas, "catch", frames)),
+        ("catch_lv10", None, lambda: bench_scene(canvas, "catch", frames, level = 10)),
+        ("catch_saturated", None, lambda: bench_scene(canvas, "catch", frames, level = 10, saturated = True)),
+    ]
+    for n in counts:
+        scenarios.append(("manager_scaling", n, lambda n = n: bench_manager(canvas, n, max(10, min(frames, 1_000_000 // n)))))
+
+    results = []
+    for scenario, n, fn in scenarios:
+        random.seed(0)
+        np.random.seed(0)
+        for phase, samples in fn().items():
+            row = {"scenario": scenario, "n": n, "phase": phase, "frames": len(samples)}
+            row.update(summarize(samples))
+            results.append(row)
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "frames": frames,
+            "dirty": dirty,
+            "texture": texture,
+        },
+        "results": results,
+    }
+
+def compare(report, baseline, threshold, min_delta):
+    key = lambda r: (r["scenario"], r["n"], r["phase"])
+    old = {key(r): r for r in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        prev = old.get(key(row))
+        if prev is None or prev["mean_ms"] <= 0:
+            continue
+        ratio = row["mean_ms"] / prev["mean_ms"]
+        if ratio > 1.0 + threshold and row["mean_ms"] - prev["mean_ms"] > min_delta:
+            regressions.append((key(row), prev["mean_ms"], row["mean_ms"], ratio))
+    return regressions
+
+def print_table(report):
+    print(f"{'scenario':<18}{'n':>8}  {'phase':<10}{'mean':>10}{'p95':>10}{'p99':>10}")
+    for r in report["results"]:
+        n = "" if r["n"] is None else r["n"]
+        print(f"{r['scenario']:<18}{n:>8}  {r['phase']:<10}{r['mean_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}")
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "씬/PotatoManager 프레임 벤치마크")
+    parser.add_argument("--frames", type = int, default = 300)
+    parser.add_argument("--counts", type = int, nargs = "+", default = [100, 1000, 10000, 100000])
+    parser.add_argument("--out", default = "bench.json")
+    parser.add_argument("--dirty", action = "store_true", help = "DirtyCanvas로 그리기")
+    parser.add_argument("--texture", action = "store_true", help = "TextureCanvas(SDL Renderer)로 그리기")
+    parser.add_argument("--compare", default = None, help = "이전 결과 JSON과 비교")
+    parser.add_argument("--threshold", type = float, default = 0.15)
+    parser.add_argument("--min-delta", type = float, default = 0.05, help = "이보다 작은 ms 차이는 무시")
+    args = parser.parse_args(argv)
+
+    report = run(args.frames, args.counts, args.dirty, args.texture)
+    with open(args.out, "w", encoding = "utf-8") as f:
+        json.dump(report, f, indent = 2)
+    print_table(report)
+
+    if args.compare:
+        with open(args.compare, encoding = "utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_delta)
+        for (scenario, n, phase), old_ms, new_ms, ratio in regressions:
+            print(f"REGRESSION {scenario} n={n} {phase}: {old_ms:.3f} -> {new_ms:.3f} ms (x{ratio:.2f})")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
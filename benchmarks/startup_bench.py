@@ -0,0 +1,86 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import statistics
+
+W, H = 600, 800
+
+def child(use_bake):
+    start = last = time.perf_counter()
+    marks = {}
+
+    def mark(name):
+        nonlocal last
+        now = time.perf_counter()
+        marks[name] = round((now - last) * 1000.0, 2)
+        last = now
+
+    import pygame
+    from engine.headless import init_display
+    from engine.canvas import Canvas
+    from engine.assets import assets
+    from scenes.menu import MainMenuScene
+    from scenes.dodge import DodgeScene
+    from scenes.catch import CatchScene
+    mark("import")
+
+    if not use_bake:
+        assets.bake_path = None
+    canvas = Canvas(init_display(W, H))
+    mark("display")
+
+    MainMenuScene(W, H).draw(canvas)
+    canvas.present()
+    mark("menu_frame")
+
+    for name, cls in (("dodge", DodgeScene), ("catch", CatchScene)):
+        cls(W, H, seed = 0).draw(canvas)
+        canvas.present()
+        mark(f"{name}_frame")
+    marks["total"] = round((last - start) * 1000.0, 2)
+    print(json.dumps(marks))
+
+def run_child(use_bake):
+    cmd = [sys.executable, "-W", "ignore", "-m", "benchmarks.startup_bench", "--child"]
+    if not use_bake:
+        cmd.append("--no-bake")
+    env = dict(os.environ, SDL_VIDEODRIVER = "dummy", SDL_AUDIODRIVER = "dummy", PYGAME_HIDE_SUPPORT_PROMPT = "1")
+    start = time.perf_counter()
+    out = subprocess.check_output(cmd, env = env, text = True)
+    wall = (time.perf_counter() - start) * 1000.0
+    marks = json.loads(out.strip().splitlines()[-1])
+    marks["process"] = round(wall, 2)
+    return marks
+
+def measure(runs):
+    samples = {"png": [], "baked": []}
+    for i in range(runs):
+        for mode in (("png", "baked") if i % 2 == 0 else ("baked", "png")):
+            samples[mode].append(run_child(mode == "baked"))
+    return {
+        mode: {k: round(statistics.median(row[k] for row in rows), 2) for k in rows[0]}
+        for mode, rows in samples.items()
+    }
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "실행부터 첫 프레임까지 걸리는 시간 측정")
+    parser.add_argument("--runs", type = int, default = 7)
+    parser.add_argument("--child", action = "store_true", help = argparse.SUPPRESS)
+    parser.add_argument("--no-bake", action = "store_true", help = "구운 스프라이트 캐시를 쓰지 않음")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(not args.no_bake)
+        return
+
+    report = measure(args.runs)
+    print(f"{'':12}{'png ms':>10}{'baked ms':>10}{'diff':>10}")
+    for key in report["png"]:
+        png, baked = report["png"][key], report["baked"][key]
+        print(f"{key:12}{png:>10.2f}{baked:>10.2f}{baked - png:>+10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import threading
+import pygame
+from engine.bake import BAKE_PATH, BakedSprites
+
+FONT_PATH = "./fonts/PretendardVariable.ttf"
+
+class SpriteVariants:
+    def __init__(self, base):
+        self.base = base
+        self._cache = {(False, False, 0, None): base}
+
+    def get(self, flip_x = False, flip_y = False, angle = 0, tint = None):
+        key = (flip_x, flip_y, angle % 360, tint)
+        surf = self._cache.get(key)
+        if surf is None:
+            surf = self.base
+            if flip_x or flip_y:
+                surf = pygame.transform.flip(surf, flip_x, flip_y)
+            if key[2]:
+                surf = pygame.transform.rotate(surf, key[2])
+            if tint is not None:
+                surf = surf.copy()
+                surf.fill(tint, special_flags = pygame.BLEND_RGBA_MULT)
+            self._cache[key] = surf
+        return surf
+
+class AssetManager:
+    def __init__(self, font_path = FONT_PATH, bake_path = BAKE_PATH):
+        self.font_path = font_path
+        self.bake_path = bake_path
+        self._baked = None
+        self._lock = threading.RLock()
+        self._images = {}
+        self._raw = {}
+        self._fonts = {}
+        self._variants = {}
+
+    def image(self, path, size = None, alpha = True):
+        with self._lock:
+            key = (path, size, alpha)
+            surf = self._images.get(key)
+            if surf is not None:
+                return surf
+            surf = self._from_bake(path, size, alpha)
+            if surf is not None:
+                self._images[key] = surf
+                if size is None:
+                    self._raw.pop(path, None)
+                return surf
+            if size is None:
+                loaded = self._raw.pop(path, None)
+                if loaded is None:
+                    loaded = pygame.image.load(path)
+                surf = loaded.convert_alpha() if alpha else loaded.convert()
+            else:
+                surf = pygame.transform.scale(self.image(path, None, alpha), size)
+            self._images[key] = surf
+            return surf
+
+    def prefetch(self, path, size = None, alpha = True):
+        with self._lock:
+            if (path, size, alpha) in self._images or path in self._raw:
+                return
+            baked = self._bake()
+            if baked is not None and baked.has(path, size, alpha):
+                return
+            self._raw[path] = pygame.image.load(path)
+
+    def _bake(self):
+        if self.bake_path is None:
+            return None
+        if self._baked is None:
+            self._baked = BakedSprites.load(self.bake_path)
+        return self._baked
+
+    def _from_bake(self, path, size, alpha):
+        baked = self._bake()
+        return None if baked is None else baked.get(path, size, alpha)
+
+    def variants(self, surface):
+        variants = self._variants.get(surface)
+        if variants is None:
+            variants = self._variants[surface] = SpriteVariants(surface)
+        return variants
+
+    def font(self, size):
+        with self._lock:
+            font = self._fonts.get(size)
+            if font is None:
+                try:
+                    font = pygame.font.Font(self.font_path, size)
+                except FileNotFoundError:
+                    font = pygame.font.SysFont(None, size)
+                self._fonts[size] = font
+            return font
+
+    def clear(self):
+        self._images.clear()
+        self._raw.clear()
+        self._fonts.clear()
+        self._variants.clear()
+        self._baked = None
+
+assets = AssetManager()
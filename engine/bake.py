@@ -0,0 +1,110 @@
+import json
+import time
+import struct
+import hashlib
+import argparse
+import pygame
+
+MAGIC = b"PTAB"
+VERSION = 1
+HEADER = struct.Struct("<4sBI")
+BAKE_PATH = "./images/sprites.bake"
+
+SPRITES = (
+    ("./images/background.png", None, False),
+    ("./images/player.png", (45, 70), True),
+    ("./images/poisonous_potato.png", (30, 23), True),
+    ("./images/bucket.png", (70, 48), True),
+    ("./images/potato.png", (29, 24), True),
+)
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def pixel_format():
+    screen = pygame.display.get_surface()
+    if screen is not None and screen.get_masks()[:3] == (0xFF0000, 0xFF00, 0xFF):
+        return "BGRA"
+    return "RGBA"
+
+class BakedSprites:
+    def __init__(self, entries = None, blob = b""):
+        self.entries = entries or {}
+        self.blob = blob
+        self._hashes = {}
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            magic, version, index_len = HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return cls()
+        if magic != MAGIC or version != VERSION:
+            return cls()
+        start = HEADER.size + index_len
+        index = json.loads(data[HEADER.size:start].decode("utf-8"))
+        entries = {(e["path"], tuple(e["size"]) if e["size"] else None, e["alpha"]): e for e in index}
+        return cls(entries, memoryview(data)[start:])
+
+    def _source_hash(self, path):
+        digest = self._hashes.get(path)
+        if digest is None:
+            try:
+                digest = self._hashes[path] = file_hash(path)
+            except OSError:
+                return None
+        return digest
+
+    def has(self, path, size, alpha):
+        entry = self.entries.get((path, size, alpha))
+        return entry is not None and entry["sha1"] == self._source_hash(path)
+
+    def get(self, path, size, alpha):
+        if not self.has(path, size, alpha):
+            return None
+        entry = self.entries[(path, size, alpha)]
+        offset, length = entry["offset"], entry["length"]
+        surf = pygame.image.frombuffer(self.blob[offset:offset + length], (entry["w"], entry["h"]), entry["fmt"])
+        return surf.convert_alpha() if alpha else surf.convert()
+
+def bake(sprites = SPRITES, out = BAKE_PATH):
+    fmt = pixel_format()
+    index, chunks, offset = [], [], 0
+    for path, size, alpha in sprites:
+        surf = pygame.image.load(path)
+        if size is not None:
+            surf = pygame.transform.scale(surf, size)
+        pixels = pygame.image.tobytes(surf, fmt)
+        w, h = surf.get_size()
+        index.append({
+            "path": path, "size": list(size) if size else None, "alpha": alpha,
+            "sha1": file_hash(path), "fmt": fmt, "w": w, "h": h,
+            "offset": offset, "length": len(pixels),
+        })
+        chunks.append(pixels)
+        offset += len(pixels)
+    meta = json.dumps(index, ensure_ascii = False).encode("utf-8")
+    with open(out, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(meta)))
+        f.write(meta)
+        for chunk in chunks:
+            f.write(chunk)
+    return index
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "스프라이트를 미리 줄여서 캐시 파일로 굽습니다")
+    parser.add_argument("--out", default = BAKE_PATH)
+    args = parser.parse_args(argv)
+
+    from engine.headless import init_display
+    init_display(600, 800)
+    start = time.perf_counter()
+    index = bake(out = args.out)
+    total = sum(e["length"] for e in index)
+    print(f"{len(index)}개 스프라이트, {total / 1024:.1f} KiB -> {args.out} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+from itertools import chain, repeat
+
+class SpriteBatch:
+    def __init__(self):
+        self._runs = []
+
+    def add(self, image, pos):
+        self._runs.append(((image, pos),))
+
+    def add_many(self, image, coords):
+        self._runs.append(zip(repeat(image), coords))
+
+    def flush(self, canvas):
+        if self._runs:
+            canvas.blits(chain.from_iterable(self._runs))
+            self._runs.clear()
@@ -0,0 +1,54 @@
+import numpy as np
+import pygame
+
+class DodgeBot:
+    def __init__(self, margin = 24, horizon = 240):
+        self.margin = margin
+        self.horizon = horizon
+
+    def __call__(self, scene):
+        p = scene.player.rect
+        s = scene.manager.potatoes
+        x, y = s.x, s.y(slice(None))
+        danger = (
+            s.alive & (y + s.h > p.top - self.horizon) & (y < p.bottom)
+            & (x < p.right + self.margin) & (x + s.w > p.left - self.margin)
+        )
+        if not danger.any():
+            return ()
+        threat = float((x[danger] + s.w / 2).mean())
+        go_left = threat > p.centerx
+        if go_left and p.left < self.margin:
+            go_left = False
+        elif not go_left and p.right > scene.W - self.margin:
+            go_left = True
+        return (pygame.K_LEFT,) if go_left else (pygame.K_RIGHT,)
+
+class CatchBot:
+    def __init__(self, deadzone = 6):
+        self.deadzone = deadzone
+
+    def __call__(self, scene):
+        b = scene.bucket.rect
+        s = scene.manager.potatoes
+        if not s.count:
+            return ()
+        y, speed = s.y(slice(None)), s.speed
+        centers = s.x + s.w / 2
+        eta = (b.top - y - s.h) / np.maximum(speed, 1.0)
+        reach = np.abs(centers - b.centerx) / scene.bucket.speed
+        eta = np.where(s.alive & (y < b.bottom) & (reach <= np.maximum(eta, 0.0) + 0.05), eta, np.inf)
+        i = int(eta.argmin())
+        if not np.isfinite(eta[i]):
+            return ()
+        target = centers[i]
+        if target < b.centerx - self.deadzone:
+            return (pygame.K_LEFT,)
+        if target > b.centerx + self.deadzone:
+            return (pygame.K_RIGHT,)
+        return ()
+
+BOTS = {
+    "dodge": DodgeBot,
+    "catch": CatchBot,
+}
@@ -0,0 +1,175 @@
+import weakref
+import pygame
+from pygame._sdl2 import video
+
+class Canvas:
+    def __init__(self, surface):
+        self.surface = surface
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def background(self, image):
+        self.surface.blit(image, (0, 0))
+
+    def fill(self, color):
+        self.surface.fill(color)
+
+    def blit(self, image, dest, area = None, special_flags = 0):
+        return self.surface.blit(image, dest, area, special_flags)
+
+    def blits(self, sequence):
+        self.surface.blits(sequence, doreturn = False)
+
+    def rect(self, color, rect, width = 0, border_radius = 0):
+        return pygame.draw.rect(self.surface, color, rect, width, border_radius = border_radius)
+
+    def circle(self, color, center, radius, width = 0):
+        return pygame.draw.circle(self.surface, color, center, radius, width)
+
+    def changed(self, image):
+        pass
+
+    def invalidate(self):
+        pass
+
+    def present(self, full = False):
+        pygame.display.flip()
+
+class DirtyCanvas(Canvas):
+    def __init__(self, surface, full_ratio = 0.5):
+        super().__init__(surface)
+        w, h = surface.get_size()
+        self.full_area = w * h * full_ratio
+        self._prev = []
+        self._cur = []
+        self._full = True
+        self._flip = False
+
+    def _mark(self, rect):
+        self._cur.append(rect)
+        return rect
+
+    def background(self, image):
+        if self._full:
+            self.surface.blit(image, (0, 0))
+            self._full, self._flip = False, True
+            return
+        for r in self._prev:
+            self.surface.blit(image, r, r)
+
+    def fill(self, color):
+        if self._full:
+            self.surface.fill(color)
+            self._full, self._flip = False, True
+            return
+        for r in self._prev:
+            self.surface.fill(color, r)
+
+    def blit(self, image, dest, area = None, special_flags = 0):
+        return self._mark(self.surface.blit(image, dest, area, special_flags))
+
+    def blits(self, sequence):
+        self._cur.extend(self.surface.blits(sequence))
+
+    def rect(self, color, rect, width = 0, border_radius = 0):
+        return self._mark(super().rect(color, rect, width, border_radius))
+
+    def circle(self, color, center, radius, width = 0):
+        return self._mark(super().circle(color, center, radius, width))
+
+    def invalidate(self):
+        self._full = True
+
+    def present(self, full = False):
+        rects = self._prev + self._cur
+        if self._flip or full or sum(r.w * r.h for r in rects) > self.full_area:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        self._prev, self._cur = self._cur, []
+        self._flip = False
+        if full:
+            self._full = True
+
+class TextureCanvas(Canvas):
+    def __init__(self, size, title = "", vsync = False):
+        super().__init__(None)
+        self.window = video.Window(title, size)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated = 1, vsync = vsync)
+            self.accelerated = True
+        except (pygame.error, video.error):
+            self.renderer = video.Renderer(self.window, accelerated = 0)
+            self.accelerated = False
+        self.size = tuple(size)
+        self._textures = weakref.WeakKeyDictionary()
+        self._stale = weakref.WeakSet()
+        self._shapes = {}
+
+    def get_size(self):
+        return self.size
+
+    def texture(self, image):
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = self._textures[image] = video.Texture.from_surface(self.renderer, image)
+        elif image in self._stale:
+            texture.update(image)
+            self._stale.discard(image)
+        return texture
+
+    def changed(self, image):
+        if image in self._textures:
+            self._stale.add(image)
+
+    def _shape(self, key, size, paint):
+        texture = self._shapes.get(key)
+        if texture is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            paint(surf)
+            texture = self._shapes[key] = video.Texture.from_surface(self.renderer, surf)
+        return texture
+
+    def background(self, image):
+        self.blit(image, (0, 0))
+
+    def fill(self, color):
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.clear()
+
+    def blit(self, image, dest, area = None, special_flags = 0):
+        w, h = image.get_size() if area is None else pygame.Rect(area).size
+        rect = pygame.Rect(dest[0], dest[1], w, h)
+        self.texture(image).draw(area, rect)
+        return rect
+
+    def blits(self, sequence):
+        last = texture = None
+        for image, dest in sequence:
+            if image is not last:
+                texture, last = self.texture(image), image
+                w, h = image.get_size()
+            texture.draw(None, (dest[0], dest[1], w, h))
+
+    def rect(self, color, rect, width = 0, border_radius = 0):
+        rect = pygame.Rect(rect)
+        if not width and not border_radius:
+            self.renderer.draw_color = pygame.Color(color)
+            self.renderer.fill_rect(rect)
+            return rect
+        local = pygame.Rect((0, 0), rect.size)
+        paint = lambda surf: pygame.draw.rect(surf, color, local, width, border_radius = border_radius)
+        self._shape(("rect", tuple(color), rect.size, width, border_radius), rect.size, paint).draw(None, rect)
+        return rect
+
+    def circle(self, color, center, radius, width = 0):
+        size = (radius * 2, radius * 2)
+        paint = lambda surf: pygame.draw.circle(surf, color, (radius, radius), radius, width)
+        rect = pygame.Rect((0, 0), size)
+        rect.center = center
+        self._shape(("circle", tuple(color), radius, width), size, paint).draw(None, rect)
+        return rect
+
+    def present(self, full = False):
+        self.renderer.present()
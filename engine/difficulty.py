@@ -0,0 +1,16 @@
+def merge_difficulty(defaults, overrides = None):
+    merged = dict(defaults)
+    for key, value in (overrides or {}).items():
+        if key not in defaults:
+            raise ValueError(f"알 수 없는 난이도 항목 '{key}' (가능: {', '.join(defaults)})")
+        default = defaults[key]
+        if isinstance(default, tuple):
+            if not isinstance(value, (tuple, list)) or len(value) != len(default):
+                raise ValueError(f"난이도 항목 '{key}'는 값 {len(default)}개짜리 튜플이어야 합니다 (기본값 {default}, 받은 값 {value!r})")
+            value = tuple(value)
+        elif isinstance(value, (tuple, list, bool)) or not isinstance(value, (int, float)):
+            raise ValueError(f"난이도 항목 '{key}'는 숫자 하나여야 합니다 (기본값 {default}, 받은 값 {value!r})")
+        elif isinstance(default, int) and not isinstance(value, int):
+            raise ValueError(f"난이도 항목 '{key}'는 정수여야 합니다 (기본값 {default}, 받은 값 {value!r})")
+        merged[key] = value
+    return merged
@@ -0,0 +1,39 @@
+import time
+from collections import deque
+
+class FrameGovernor:
+    def __init__(self, max_fps = 60, ladder = (120, 90, 60, 45, 30), window = 60, headroom = 0.85, recover = 0.6):
+        self.levels = sorted({f for f in ladder if f <= max_fps} | {max_fps}, reverse = True)
+        self.headroom = headroom
+        self.recover = recover
+        self.samples = deque(maxlen = window)
+        self.index = 0
+        self._start = None
+
+    @property
+    def fps(self):
+        return self.levels[self.index]
+
+    def begin_frame(self):
+        self._start = time.perf_counter()
+
+    def end_frame(self):
+        if self._start is None:
+            return self.fps
+        self.samples.append(time.perf_counter() - self._start)
+        self._start = None
+        if len(self.samples) < self.samples.maxlen:
+            return self.fps
+        cost = sorted(self.samples)[int(len(self.samples) * 0.9)]
+        if self.index < len(self.levels) - 1 and cost > self.headroom / self.fps:
+            self.index += 1
+            self.samples.clear()
+        elif self.index > 0 and cost < self.recover / self.levels[self.index - 1]:
+            self.index -= 1
+            self.samples.clear()
+        return self.fps
+
+    def reset(self):
+        self.index = 0
+        self.samples.clear()
+        self._start = None
@@ -0,0 +1,71 @@
+import os
+import sys
+import json
+import argparse
+import pygame
+from engine.input import ScriptedInput
+from engine.canvas import Canvas
+from engine.bots import BOTS
+from engine.replay import scene_result
+from engine.timestep import TICK_RATE
+
+def init_display(W, H):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (W, H):
+        screen = pygame.display.set_mode((W, H))
+    return screen
+
+class HeadlessRunner:
+    def __init__(self, scene_cls, W = 600, H = 800, dt = 1 / TICK_RATE, bot = None, script = None, render = False, seed = None, difficulty = None):
+        self.screen = init_display(W, H)
+        self.canvas = Canvas(self.screen)
+        self.input = ScriptedInput(script)
+        self.scene = scene_cls(W, H, input_source = self.input, seed = seed, difficulty = difficulty)
+        self.dt = dt
+        self.bot = bot
+        self.render = render
+        self.ticks = 0
+
+    def step(self):
+        if self.bot is not None:
+            self.input.set(self.bot(self.scene))
+        self.scene.update(self.dt)
+        if self.render and not self.scene.game_over:
+            self.scene.draw(self.canvas)
+        self.ticks += 1
+
+    def run(self, seconds = 300.0):
+        for _ in range(round(seconds / self.dt)):
+            if self.scene.game_over:
+                break
+            self.step()
+        return self.result()
+
+    def result(self):
+        result = {"ticks": self.ticks, "seed": self.scene.seed}
+        result.update(scene_result(self.scene))
+        return result
+
+def main(argv = None):
+    from main import SCENES
+
+    parser = argparse.ArgumentParser(description = "화면 없이 고정 dt로 게임 씬을 시뮬레이션합니다.")
+    parser.add_argument("scene", choices = ("dodge", "catch"))
+    parser.add_argument("--seconds", type = float, default = 300.0)
+    parser.add_argument("--dt", type = float, default = 1 / TICK_RATE)
+    parser.add_argument("--seed", type = int, default = None)
+    parser.add_argument("--idle", action = "store_true", help = "봇 없이 입력 없이 실행")
+    parser.add_argument("--render", action = "store_true")
+    args = parser.parse_args(argv)
+
+    bot = None if args.idle else BOTS[args.scene]()
+    runner = HeadlessRunner(SCENES[args.scene], dt = args.dt, bot = bot, render = args.render, seed = args.seed)
+    json.dump(runner.run(args.seconds), sys.stdout)
+    print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import pygame
+
+class KeyState:
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+class KeyboardInput:
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+class ScriptedInput:
+    def __init__(self, script = None):
+        self.script = script
+        self.tick = 0
+        self.held = frozenset()
+
+    def set(self, keys):
+        self.held = frozenset(keys)
+
+    def get_pressed(self):
+        if self.script is not None:
+            self.held = frozenset(self.script(self.tick))
+        self.tick += 1
+        return KeyState(self.held)
@@ -0,0 +1,125 @@
+import queue
+import threading
+from engine.assets import assets
+
+class _Job:
+    def __init__(self, name, factory, images, fonts):
+        self.name = name
+        self.factory = factory
+        self.images = images
+        self.fonts = fonts
+        self.done = 0
+        self.scene = None
+        self.error = None
+        self.converted = threading.Event()
+
+    @property
+    def total(self):
+        return 2 * len(self.images) + len(self.fonts) + 1
+
+    @property
+    def finished(self):
+        return self.done == self.total
+
+class SceneLoader:
+    def __init__(self):
+        self._jobs = {}
+        self._convert = []
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._stop = False
+        self._thread = threading.Thread(target = self._run, name = "scene-loader", daemon = True)
+        self._thread.start()
+
+    def preload(self, name, cls, *args, **kwargs):
+        with self._lock:
+            if name in self._jobs:
+                return
+            job = self._jobs[name] = _Job(name, lambda: cls(*args, **kwargs),
+                                          tuple(getattr(cls, "IMAGES", ())), tuple(getattr(cls, "FONTS", ())))
+        self._queue.put(job)
+
+    @property
+    def busy(self):
+        with self._lock:
+            return any(not job.finished for job in self._jobs.values())
+
+    def pending(self, name):
+        return name in self._jobs
+
+    def loading(self, name):
+        return self.pending(name) and not self.ready(name)
+
+    def progress(self, name):
+        with self._lock:
+            if name not in self._jobs:
+                return None
+            jobs = self._jobs.values()
+            return sum(job.done for job in jobs) / sum(job.total for job in jobs)
+
+    def ready(self, name):
+        with self._lock:
+            return name in self._jobs and all(job.finished for job in self._jobs.values())
+
+    def pump(self):
+        with self._lock:
+            job = self._convert.pop(0) if self._convert else None
+        if job is None:
+            return
+        try:
+            for spec in job.images:
+                assets.image(*spec)
+                with self._lock:
+                    job.done += 1
+        except Exception as e:
+            with self._lock:
+                job.error = e
+        job.converted.set()
+
+    def take(self, name):
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None or not all(j.finished for j in self._jobs.values()):
+                return None
+            del self._jobs[name]
+        if job.error is not None:
+            raise job.error
+        return job.scene
+
+    def close(self):
+        self._stop = True
+        with self._lock:
+            for job in self._jobs.values():
+                job.converted.set()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _step(self, job, fn, *args):
+        fn(*args)
+        with self._lock:
+            job.done += 1
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None or self._stop:
+                return
+            scene, error = None, None
+            try:
+                for spec in job.images:
+                    self._step(job, assets.prefetch, *spec)
+                for size in job.fonts:
+                    self._step(job, assets.font, size)
+                with self._lock:
+                    self._convert.append(job)
+                job.converted.wait()
+                if self._stop:
+                    return
+                if job.error is None:
+                    scene = job.factory()
+            except Exception as e:
+                error = e
+            with self._lock:
+                job.scene = scene
+                job.error = job.error or error
+                job.done = job.total
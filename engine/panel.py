@@ -0,0 +1,38 @@
+import pygame
+
+class GameOverPanel:
+    def __init__(self, W, H, card_size, title_font, font, hint_font, title = "GAME OVER", hint = "R : 재시작 | ESC : 메뉴"):
+        self.W, self.H = W, H
+        self.font = font
+        self.card = pygame.Rect((0, 0), card_size)
+        self.card.center = (W // 2, H // 2)
+
+        self._base = pygame.Surface((W, H), pygame.SRCALPHA)
+        self._base.fill((0, 0, 0, 160))
+        pygame.draw.rect(self._base, (245, 245, 245), self.card, border_radius = 18)
+        pygame.draw.rect(self._base, (220, 220, 220), self.card, 2, border_radius = 18)
+        self._text_center(self._base, title, title_font, (30, 30, 30), self.card.top + 70)
+        self._text_center(self._base, hint, hint_font, (90, 90, 90), self.card.top + 290)
+        self.surface = None
+        self._lines = None
+
+    def _text_center(self, surface, text, font, color, y):
+        s = font.render(text, True, color)
+        surface.blit(s, s.get_rect(center = (self.W // 2, y)))
+
+    def show(self, lines, top = 140, gap = 40):
+        lines = tuple(lines)
+        if self.surface is not None and lines == self._lines:
+            return
+        self._lines = lines
+        self.surface = self._base.copy()
+        for i, line in enumerate(lines):
+            self._text_center(self.surface, line, self.font, (50, 50, 50), self.card.top + top + gap * i)
+
+    def hide(self):
+        self.surface = None
+        self._lines = None
+
+    def draw(self, screen):
+        if self.surface is not None:
+            screen.blit(self.surface, (0, 0))
@@ -0,0 +1,63 @@
+import threading
+
+class SimWorker:
+    def __init__(self):
+        self.frames = [None, None]
+        self.front = 0
+        self.busy = False
+        self._job = None
+        self._error = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target = self._run, name = "sim", daemon = True)
+        self._thread.start()
+
+    @property
+    def frame(self):
+        return self.frames[self.front]
+
+    def prime(self, frame):
+        self.frames[self.front] = frame
+
+    def submit(self, fn, *args):
+        if self.busy:
+            raise RuntimeError("이전 시뮬레이션 결과를 아직 받지 않았습니다")
+        with self._cond:
+            self._job = (fn, args)
+            self.busy = True
+            self._cond.notify_all()
+
+    def collect(self):
+        if not self.busy:
+            return self.frame
+        with self._cond:
+            while self._job is not None:
+                self._cond.wait()
+            self.busy = False
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        self.front = 1 - self.front
+        return self.frame
+
+    def close(self):
+        self.collect()
+        with self._cond:
+            self._job = (None, ())
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._job is None:
+                    self._cond.wait()
+                fn, args = self._job
+            if fn is None:
+                return
+            try:
+                self.frames[1 - self.front] = fn(*args)
+            except BaseException as e:
+                self._error = e
+            with self._cond:
+                self._job = None
+                self._cond.notify_all()
@@ -0,0 +1,209 @@
+import heapq
+import numpy as np
+
+EPS = 1e-6
+SCALAR_BAND = 32
+
+class _Schedule:
+    def __init__(self):
+        self.level = None
+        self.heap = []
+
+    def due(self, until):
+        heap, out = self.heap, []
+        while heap and heap[0][0] <= until:
+            out.append(heapq.heappop(heap))
+        return out
+
+    def push_many(self, times, slots, gens):
+        for entry in zip(times.tolist(), slots.tolist(), gens.tolist()):
+            heapq.heappush(self.heap, entry)
+
+def _empty_band():
+    return (np.empty(0, dtype = np.intp), np.empty(0, dtype = np.int64)) + tuple(np.empty(0) for _ in range(4))
+
+class PotatoStore:
+    def __init__(self, w, h, capacity = 128):
+        self.w, self.h = w, h
+        self.half_w = w // 2
+        self.clock = self.prev_clock = 0.0
+        self.x = np.zeros(capacity)
+        self.y0 = np.zeros(capacity)
+        self.t0 = np.zeros(capacity)
+        self.speed = np.ones(capacity)
+        self.gen = np.zeros(capacity, dtype = np.int64)
+        self.alive = np.zeros(capacity, dtype = bool)
+        self.count = 0
+        self._top = 0
+        self._free = []
+        self._exits = _Schedule()
+        self._enters = _Schedule()
+        self._row = None
+        self._band = _empty_band()
+        self._band_until = np.inf
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, n):
+        cap = len(self.x)
+        if n <= cap:
+            return
+        cap = max(n, cap * 2)
+        for name in ("x", "y0", "t0", "speed", "gen", "alive"):
+            old = getattr(self, name)
+            new = np.ones(cap, dtype = old.dtype) if name == "speed" else np.zeros(cap, dtype = old.dtype)
+            new[:self._top] = old[:self._top]
+            setattr(self, name, new)
+
+    def _at(self, slots, level):
+        return self.t0[slots] + (level - self.y0[slots]) / self.speed[slots]
+
+    def _schedule(self, slots):
+        gens = self.gen[slots]
+        for schedule in (self._exits, self._enters):
+            if schedule.level is not None:
+                schedule.push_many(self._at(slots, schedule.level), slots, gens)
+
+    def add(self, x, speed, y = -60.0):
+        self.add_many((x,), (speed,), y)
+
+    def add_many(self, xs, speeds, y = -60.0):
+        k = len(xs)
+        if not k:
+            return
+        reuse = min(k, len(self._free))
+        fresh = k - reuse
+        self._reserve(self._top + fresh)
+        slots = np.concatenate((
+            np.array(self._free[len(self._free) - reuse:], dtype = np.intp),
+            np.arange(self._top, self._top + fresh, dtype = np.intp),
+        ))
+        del self._free[len(self._free) - reuse:]
+        self._top += fresh
+
+        self.x[slots] = np.asarray(xs, dtype = float) - self.half_w
+        self.y0[slots] = y
+        self.t0[slots] = self.clock
+        self.speed[slots] = speeds
+        self.alive[slots] = True
+        self.count += k
+        self._schedule(slots)
+
+    def step(self, dt):
+        self.prev_clock = self.clock
+        self.clock += dt
+
+    def live(self):
+        return np.flatnonzero(self.alive[:self._top])
+
+    def y(self, slots, clock = None):
+        clock = self.clock if clock is None else clock
+        return self.y0[slots] + self.speed[slots] * (clock - self.t0[slots])
+
+    def _live(self, entries):
+        if not entries:
+            return None, None
+        _, slots, gens = zip(*entries)
+        slots = np.array(slots, dtype = np.intp)
+        gens = np.array(gens, dtype = np.int64)
+        keep = self.gen[slots] == gens
+        return slots[keep], gens[keep]
+
+    def _rebuild(self, schedule, level):
+        schedule.level = level
+        slots = self.live()
+        times = self._at(slots, level)
+        schedule.heap = list(zip(times.tolist(), slots.tolist(), self.gen[slots].tolist()))
+        heapq.heapify(schedule.heap)
+
+    def _track_row(self, top, bottom):
+        if self._row != (top, bottom):
+            self._row = (top, bottom)
+            self._rebuild(self._enters, top - self.h)
+            self._band, self._band_until = _empty_band(), np.inf
+        slots, gens = self._live(self._enters.due(self.clock + EPS))
+        if slots is not None and len(slots):
+            leave = self._at(slots, bottom)
+            inside = leave > self.prev_clock - EPS
+            slots, gens, leave = slots[inside], gens[inside], leave[inside]
+            speed = self.speed[slots]
+            entered = (slots, gens, self.x[slots], self.y0[slots] - speed * self.t0[slots], speed, leave)
+            self._band = tuple(map(np.concatenate, zip(self._band, entered)))
+            if len(leave):
+                self._band_until = min(self._band_until, float(leave.min()))
+        if self._band_until < self.prev_clock - EPS:
+            slots, gens, *_, leave = self._band
+            keep = (leave > self.prev_clock - EPS) & (self.gen[slots] == gens)
+            self._band = tuple(f[keep] for f in self._band)
+            self._band_until = float(self._band[5].min()) if keep.any() else np.inf
+
+    def _hits(self, rect):
+        self._track_row(rect.top, rect.bottom)
+        slots, gens, left, base, speed, _ = self._band
+        if not len(slots):
+            return slots
+        prev, now = self.prev_clock, self.clock
+        r_left, r_right, r_top, r_bottom = rect.left - self.w, rect.right, rect.top - self.h, rect.bottom
+        if len(slots) <= SCALAR_BAND:
+            hit = [
+                i for i, (l, b, v) in enumerate(zip(left.tolist(), base.tolist(), speed.tolist()))
+                if r_left < l < r_right and b + v * prev < r_bottom and b + v * now > r_top
+            ]
+            if not hit:
+                return slots[:0]
+        else:
+            hit = (left < r_right) & (left > r_left) & (base + speed * prev < r_bottom) & (base + speed * now > r_top)
+        slots, gens = slots[hit], gens[hit]
+        return slots[self.gen[slots] == gens]
+
+    def any_hit(self, rect) -> bool:
+        return bool(len(self._hits(rect)))
+
+    def kill_hit(self, rect) -> int:
+        return self._kill(self._hits(rect))
+
+    def kill_below(self, limit) -> int:
+        if self._exits.level != limit:
+            self._rebuild(self._exits, limit)
+        slots, gens = self._live(self._exits.due(self.clock + EPS))
+        if slots is None or not len(slots):
+            return 0
+        out = self.y(slots) > limit
+        if not out.all():
+            pending = ~out
+            self._exits.push_many(self._at(slots[pending], limit), slots[pending], gens[pending])
+        return self._kill(slots[out])
+
+    def _kill(self, slots) -> int:
+        if not len(slots):
+            return 0
+        self.alive[slots] = False
+        self.gen[slots] += 1
+        self._free.extend(slots.tolist())
+        self.count -= len(slots)
+        return len(slots)
+
+    def snapshot(self):
+        slots = self.live()
+        return self.x[slots], self.y(slots, self.prev_clock), self.y(slots)
+
+    def coords(self, alpha = 1.0):
+        slots = self.live() if self.count < self._top else slice(0, self._top)
+        clock = self.prev_clock + (self.clock - self.prev_clock) * alpha
+        return np.rint(np.column_stack((self.x[slots], self.y(slots, clock)))).astype(np.intp).tolist()
+
+    def clear(self):
+        self.alive[:self._top] = False
+        self.gen[:self._top] += 1
+        self.count = 0
+        self._top = 0
+        self._free.clear()
+        self._exits.heap.clear()
+        self._enters.heap.clear()
+        self._band, self._band_until = _empty_band(), np.inf
+        self.clock = self.prev_clock = 0.0
+
+def interpolate(frame, alpha = 1.0):
+    x, y0, y1 = frame
+    return np.rint(np.column_stack((x, y0 + (y1 - y0) * alpha))).astype(np.intp).tolist()
@@ -0,0 +1,165 @@
+import csv
+import json
+import time
+from collections import deque
+import pygame
+from engine.assets import assets
+from engine.text import TextCache
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL = _NullSection()
+
+class _Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, self.start, time.perf_counter())
+        return False
+
+class Profiler:
+    PHASE_COLORS = {
+        "events": (120, 180, 255),
+        "update": (90, 220, 120),
+        "draw": (255, 200, 60),
+        "present": (240, 110, 90),
+        "wait": (110, 110, 110),
+    }
+
+    def __init__(self, history = 240, trace_limit = 200_000, budget_ms = 1000 / 60):
+        self.enabled = False
+        self.overlay = False
+        self.tracing = False
+        self.budget_ms = budget_ms
+        self.history = deque(maxlen = history)
+        self.trace = deque(maxlen = trace_limit)
+        self.frame_index = 0
+        self._sections = {}
+        self._frame = {}
+        self._frame_start = 0.0
+        self._origin = time.perf_counter()
+        self._text = None
+        self._panel = None
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled or self.tracing
+        if not self.enabled:
+            self.history.clear()
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self.set_enabled(self.overlay)
+
+    def start_trace(self):
+        self.tracing = True
+        self.enabled = True
+
+    def stop_trace(self, path):
+        path = self.export(path)
+        self.tracing = False
+        self.trace.clear()
+        self.set_enabled(self.overlay)
+        return path
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def _record(self, name, start, end):
+        ms = (end - start) * 1000.0
+        self._frame[name] = self._frame.get(name, 0.0) + ms
+        if self.tracing:
+            self.trace.append((self.frame_index, name, start - self._origin, end - start))
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame = {}
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = (time.perf_counter() - self._frame_start) * 1000.0
+        self.history.append((total, self._frame))
+        self.frame_index += 1
+
+    def summary(self):
+        if not self.history:
+            return 0.0, {}
+        n = len(self.history)
+        totals = {}
+        for _, phases in self.history:
+            for name, ms in phases.items():
+                totals[name] = totals.get(name, 0.0) + ms
+        return sum(t for t, _ in self.history) / n, {k: v / n for k, v in totals.items()}
+
+    def draw(self, canvas):
+        if not self.overlay:
+            return
+        if self._text is None:
+            self._text = TextCache(assets.font(16), maxsize = 128)
+        w, h = 260, 150
+        if self._panel is None:
+            self._panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel = self._panel
+        panel.fill((0, 0, 0, 170))
+
+        graph_h = 60
+        scale = graph_h / (self.budget_ms * 2)
+        budget_y = graph_h - int(self.budget_ms * scale)
+        for i, (_, phases) in enumerate(self.history):
+            x = w - len(self.history) + i
+            y = graph_h
+            for name, color in self.PHASE_COLORS.items():
+                seg = int(phases.get(name, 0.0) * scale)
+                if seg:
+                    pygame.draw.line(panel, color, (x, max(y - seg, 0)), (x, y - 1))
+                    y -= seg
+        pygame.draw.line(panel, (255, 60, 60), (0, budget_y), (w, budget_y))
+
+        mean, phases = self.summary()
+        fps = 1000.0 / mean if mean else 0.0
+        lines = [(f"frame {mean:5.2f} ms  ({fps:4.0f} fps)", (255, 255, 255))]
+        for name, color in self.PHASE_COLORS.items():
+            if name in phases:
+                lines.append((f"{name:<8}{phases[name]:6.2f} ms", color))
+        y = graph_h + 4
+        for text, color in lines:
+            surf = self._text.render(text, color)
+            panel.blit(surf, (6, y))
+            y += surf.get_height()
+        canvas.changed(panel)
+        sw, sh = canvas.get_size()
+        canvas.blit(panel, (sw - w - 8, sh - h - 8))
+
+    def export(self, path):
+        if path.endswith(".csv"):
+            with open(path, "w", newline = "", encoding = "utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(("frame", "phase", "start_ms", "dur_ms"))
+                for frame, name, start, dur in self.trace:
+                    writer.writerow((frame, name, f"{start * 1000.0:.4f}", f"{dur * 1000.0:.4f}"))
+            return path
+        events = [
+            {"name": name, "ph": "X", "ts": start * 1e6, "dur": dur * 1e6, "pid": 0, "tid": 0, "args": {"frame": frame}}
+            for frame, name, start, dur in self.trace
+        ]
+        with open(path, "w", encoding = "utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
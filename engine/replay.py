@@ -0,0 +1,189 @@
+import sys
+import zlib
+import time
+import struct
+import argparse
+import pygame
+from engine.input import KeyState, KeyboardInput, ScriptedInput
+
+MAGIC = b"PTRP"
+VERSION = 2
+HEADER = struct.Struct("<4sBBHQIIHd")
+MODES = ("dodge", "catch")
+KEY_BITS = ((pygame.K_LEFT, 1), (pygame.K_RIGHT, 2))
+
+def keys_to_mask(keys):
+    mask = 0
+    for key, bit in KEY_BITS:
+        if keys[key]:
+            mask |= bit
+    return mask
+
+def mask_to_keys(mask):
+    return frozenset(key for key, bit in KEY_BITS if mask & bit)
+
+def _write_varint(out, n):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+def _read_varint(data, i):
+    n = shift = 0
+    while True:
+        b = data[i]
+        i += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, i
+        shift += 7
+
+def scene_result(scene):
+    return {
+        "elapsed": round(scene.elapsed, 4),
+        "level": scene.level,
+        "score": getattr(scene, "score", getattr(scene, "avoided", 0)),
+        "game_over": scene.game_over,
+    }
+
+class Replay:
+    def __init__(self, mode, tick_rate, seed, ticks = 0, changes = None, score = 0, level = 1, elapsed = 0.0):
+        self.mode = mode
+        self.tick_rate = tick_rate
+        self.seed = seed
+        self.ticks = ticks
+        self.changes = changes if changes is not None else []
+        self.score = score
+        self.level = level
+        self.elapsed = elapsed
+
+    def encode(self):
+        body = bytearray()
+        last_tick = last_mask = 0
+        for tick, mask in self.changes:
+            _write_varint(body, tick - last_tick)
+            body.append(mask)
+            last_tick, last_mask = tick, mask
+        header = HEADER.pack(MAGIC, VERSION, MODES.index(self.mode), self.tick_rate, self.seed,
+                             self.ticks, self.score, self.level, self.elapsed)
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def decode(cls, data):
+        magic, version, mode, tick_rate, seed, ticks, score, level, elapsed = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("감자 게임 리플레이 파일이 아닙니다")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 버전입니다 (v{version}, 현재 v{VERSION})")
+        body = zlib.decompress(data[HEADER.size:])
+        changes, tick, i = [], 0, 0
+        while i < len(body):
+            delta, i = _read_varint(body, i)
+            tick += delta
+            changes.append((tick, body[i]))
+            i += 1
+        return cls(MODES[mode], tick_rate, seed, ticks, changes, score, level, elapsed)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+class ReplayRecorder:
+    def __init__(self, inner = None, tick_rate = 120):
+        self.inner = inner or KeyboardInput()
+        self.tick_rate = tick_rate
+        self.replay = None
+        self._mask = 0
+
+    def begin(self, mode, seed):
+        self.replay = Replay(mode, self.tick_rate, seed)
+        self._mask = 0
+
+    def get_pressed(self):
+        keys = self.inner.get_pressed()
+        replay = self.replay
+        if replay is not None:
+            mask = keys_to_mask(keys)
+            if mask != self._mask:
+                replay.changes.append((replay.ticks, mask))
+                self._mask = mask
+            replay.ticks += 1
+        return keys
+
+    def finish(self, scene):
+        replay, self.replay = self.replay, None
+        if replay is not None:
+            result = scene_result(scene)
+            replay.score, replay.level, replay.elapsed = result["score"], result["level"], scene.elapsed
+        return replay
+
+    def track(self, mode, scene, directory):
+        if self.replay is None or self.replay.mode != mode or self.replay.seed != scene.seed:
+            if scene.game_over:
+                return None
+            self.begin(mode, scene.seed)
+        if scene.game_over:
+            replay = self.finish(scene)
+            return replay.save(f"{directory}/{mode}_{time.strftime('%Y%m%d_%H%M%S')}_{replay.seed:x}.ptr")
+        return None
+
+class ReplayInput(ScriptedInput):
+    def __init__(self, replay):
+        super().__init__()
+        self.changes = replay.changes
+        self._next = 0
+        self._mask = 0
+
+    def get_pressed(self):
+        changes = self.changes
+        while self._next < len(changes) and changes[self._next][0] <= self.tick:
+            self._mask = changes[self._next][1]
+            self._next += 1
+        self.tick += 1
+        return KeyState(mask_to_keys(self._mask))
+
+def verify(replay, W = 600, H = 800):
+    from main import SCENES
+    from engine.headless import init_display
+
+    init_display(W, H)
+    source = ReplayInput(replay)
+    scene = SCENES[replay.mode](W, H, input_source = source, seed = replay.seed)
+    dt = 1.0 / replay.tick_rate
+    for _ in range(replay.ticks):
+        if scene.game_over:
+            break
+        scene.update(dt)
+    result = scene_result(scene)
+    ok = (source.tick == replay.ticks and result["score"] == replay.score
+          and result["level"] == replay.level and abs(scene.elapsed - replay.elapsed) < 1e-6)
+    return ok, result
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "리플레이 검증")
+    parser.add_argument("paths", nargs = "+")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for path in args.paths:
+        try:
+            replay = Replay.load(path)
+        except ValueError as e:
+            print(f"SKIP {path}  {e}")
+            failed += 1
+            continue
+        start = time.perf_counter()
+        ok, result = verify(replay)
+        ms = (time.perf_counter() - start) * 1000.0
+        print(f"{'OK  ' if ok else 'FAIL'} {path}  {replay.mode} ticks={replay.ticks} score={replay.score} -> {result['score']}  ({ms:.1f} ms)")
+        failed += not ok
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+import os
+import gc
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from collections import Counter
+import numpy as np
+import pygame
+from engine.timestep import FixedStep, TICK_RATE
+
+W, H = 600, 800
+MEMORY_METRICS = ("rss_kib", "traced_kib", "objects")
+FRAME_METRICS = ("frame_p50_ms", "frame_p90_ms", "frame_p99_ms")
+
+def rss_kib():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+class Autopilot:
+    def __init__(self, modes = ("dodge", "catch"), restarts = 2, max_game = 120.0, linger = 1.0, tick_rate = TICK_RATE):
+        from main import enter_scene
+        from engine.bots import BOTS
+        from engine.input import ScriptedInput
+
+        self.enter_scene = enter_scene
+        self.bots = {mode: BOTS[mode]() for mode in modes}
+        self.input = ScriptedInput()
+        self.modes = modes
+        self.restarts = restarts
+        self.max_game = max_game
+        self.linger = linger
+        self.stepper = FixedStep(tick_rate)
+        self.instances = {}
+        self.games = Counter()
+        self._mode_index = 0
+        self._restarted = 0
+        self._wait = 0.0
+        self._switch("menu")
+
+    def _switch(self, name):
+        self.name = name
+        self.scene = self.enter_scene(self.instances, name, W, H, self.input)
+        self.stepper.reset()
+        self._wait = self.linger
+
+    def _send(self, event_type, **attrs):
+        self.scene.handle_event(pygame.event.Event(event_type, **attrs))
+
+    def _press(self, key):
+        self._send(pygame.KEYDOWN, key = key, mod = 0, unicode = "", scancode = 0)
+
+    def step(self, frame_dt):
+        scene = self.scene
+        if self.name == "menu":
+            self._wait -= frame_dt
+            if self._wait <= 0.0:
+                mode = self.modes[self._mode_index % len(self.modes)]
+                self._mode_index += 1
+                button = scene.btn_dodge if mode == "dodge" else scene.btn_catch
+                self._send(pygame.MOUSEBUTTONDOWN, pos = button.rect.center, button = 1)
+        elif scene.game_over:
+            self.input.set(())
+            self._wait -= frame_dt
+            if self._wait <= 0.0:
+                self.games[self.name] += 1
+                if self._restarted < self.restarts:
+                    self._restarted += 1
+                    self._press(pygame.K_r)
+                    self._wait = self.linger
+                else:
+                    self._restarted = 0
+                    self._press(pygame.K_ESCAPE)
+        elif scene.elapsed >= self.max_game:
+            self.games[self.name] += 1
+            self._restarted = 0
+            self._press(pygame.K_ESCAPE)
+        else:
+            for _ in range(self.stepper.advance(frame_dt)):
+                self.input.set(self.bots[self.name](scene))
+                scene.update(self.stepper.dt)
+                if scene.game_over or scene.next_scene:
+                    break
+
+        if scene.next_scene:
+            self._switch(scene.next_scene)
+
+    def draw(self, canvas):
+        self.scene.draw(canvas, self.stepper.alpha)
+
+def percentiles(frame_ms):
+    p50, p90, p99 = np.percentile(frame_ms, (50, 90, 99))
+    return {
+        "frame_p50_ms": round(float(p50), 3),
+        "frame_p90_ms": round(float(p90), 3),
+        "frame_p99_ms": round(float(p99), 3),
+        "frame_max_ms": round(float(max(frame_ms)), 3),
+    }
+
+def sample(start, frames, frame_ms, pilot, trace):
+    gc.collect()
+    objects = gc.get_objects()
+    types = Counter(type(o).__name__ for o in objects)
+    row = {
+        "t_s": round(time.perf_counter() - start, 1),
+        "frames": frames,
+        "games": dict(pilot.games),
+        "rss_kib": rss_kib(),
+        "traced_kib": tracemalloc.get_traced_memory()[0] // 1024 if trace else None,
+        "objects": len(objects),
+        "top_types": dict(types.most_common(8)),
+    }
+    row.update(percentiles(frame_ms))
+    return row
+
+def trend(samples, key):
+    points = [(s["t_s"] / 3600.0, s[key]) for s in samples if s[key] is not None]
+    if len(points) < 3:
+        return None
+    hours, values = np.array(points).T
+    if np.ptp(hours) == 0.0:
+        return None
+    slope = float(np.polyfit(hours, values, 1)[0])
+    base = float(np.median(values)) or 1.0
+    third = max(1, len(values) // 3)
+    early, late = float(np.median(values[:third])) or 1.0, float(np.median(values[-third:]))
+    return {"per_hour": round(slope, 3), "rel_per_hour": round(slope / base, 5), "late_vs_early": round(late / early - 1.0, 5)}
+
+def growth_sites(baseline, snapshot, limit = 10):
+    ignore = (tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__))
+    stats = snapshot.filter_traces(ignore).compare_to(baseline.filter_traces(ignore), "lineno")
+    return [
+        {"site": str(s.traceback), "size_diff_kib": round(s.size_diff / 1024, 1), "count_diff": s.count_diff}
+        for s in stats[:limit] if s.size_diff > 0
+    ]
+
+def analyze(samples, warmup = 2, max_growth = 0.02, noise = 0.03):
+    steady = samples[warmup:]
+    trends, flags = {}, []
+    for key in MEMORY_METRICS + FRAME_METRICS:
+        result = trend(steady, key)
+        trends[key] = result
+        if result is not None and result["rel_per_hour"] > max_growth and result["late_vs_early"] > noise:
+            flags.append(f"{key} 증가 추세: 시간당 {result['rel_per_hour'] * 100:.1f}% ({result['per_hour']:+.1f}/h)")
+    if len(steady) >= 2:
+        first, last = steady[0]["top_types"], steady[-1]["top_types"]
+        for name, count in last.items():
+            if count > first.get(name, 0) * (1 + max_growth) + 100:
+                flags.append(f"{name} 객체 수 증가: {first.get(name, 0)} -> {count}")
+    return trends, flags
+
+def soak(hours = 1.0, interval = 60.0, fps = 60, tick_rate = TICK_RATE, realtime = False, trace = True, warmup = 2, max_growth = 0.02, restarts = 2, max_game = 120.0):
+    from engine.headless import init_display
+    from engine.canvas import Canvas
+
+    canvas = Canvas(init_display(W, H))
+    if trace:
+        tracemalloc.start(1)
+    pilot = Autopilot(restarts = restarts, max_game = max_game, tick_rate = tick_rate)
+    clock = pygame.time.Clock()
+
+    start = time.perf_counter()
+    end = start + hours * 3600.0
+    next_sample = start + interval
+    samples, frame_ms, frames = [], [], 0
+    baseline = None
+    frame_dt = 1 / fps
+    while True:
+        t = time.perf_counter()
+        pygame.event.pump()
+        pilot.step(frame_dt)
+        pilot.draw(canvas)
+        canvas.present()
+        frame_ms.append((time.perf_counter() - t) * 1000.0)
+        frames += 1
+        if realtime:
+            frame_dt = clock.tick(fps) / 1000.0
+
+        now = time.perf_counter()
+        if now >= next_sample or now >= end:
+            row = sample(start, frames, frame_ms, pilot, trace)
+            samples.append(row)
+            frame_ms.clear()
+            print(f"[{row['t_s']:>8.0f}s] rss {row['rss_kib']} KiB  traced {row['traced_kib']} KiB  "
+                  f"objects {row['objects']}  p90 {row['frame_p90_ms']:.2f} ms  games {sum(pilot.games.values())}",
+                  file = sys.stderr)
+            if trace and len(samples) == warmup + 1:
+                baseline = tracemalloc.take_snapshot()
+            next_sample = now + interval
+            if now >= end:
+                break
+
+    trends, flags = analyze(samples, warmup, max_growth)
+    report = {
+        "hours": hours,
+        "interval_s": interval,
+        "fps": fps,
+        "tick_rate": tick_rate,
+        "frames": frames,
+        "games": dict(pilot.games),
+        "samples": samples,
+        "trends": trends,
+        "flags": flags,
+    }
+    if trace:
+        if baseline is not None:
+            report["growth_sites"] = growth_sites(baseline, tracemalloc.take_snapshot())
+        tracemalloc.stop()
+    return report
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "자동 조종으로 메뉴 → 피하기 → 받기를 오래 돌리며 메모리/프레임 추세를 기록합니다")
+    parser.add_argument("--hours", type = float, default = 1.0)
+    parser.add_argument("--interval", type = float, default = 60.0, help = "샘플 간격(초)")
+    parser.add_argument("--fps", type = int, default = 60, help = "프레임마다 흘려보내는 시간은 1/fps초")
+    parser.add_argument("--tick-rate", type = int, default = TICK_RATE, help = "초당 시뮬레이션 틱 수 (게임과 같은 FixedStep)")
+    parser.add_argument("--realtime", action = "store_true", help = "fps로 제한하고 실제로 흐른 시간만큼 시뮬레이션")
+    parser.add_argument("--no-tracemalloc", action = "store_true", help = "tracemalloc을 끄고 RSS/객체 수만 기록")
+    parser.add_argument("--warmup", type = int, default = 2, help = "추세 계산에서 뺄 앞쪽 샘플 수")
+    parser.add_argument("--max-growth", type = float, default = 0.02, help = "경고할 시간당 증가율")
+    parser.add_argument("--restarts", type = int, default = 2, help = "메뉴로 돌아가기 전 R로 재시작하는 횟수")
+    parser.add_argument("--max-game", type = float, default = 120.0, help = "한 판 최대 시간(초), 넘으면 ESC")
+    parser.add_argument("--out", default = "soak.json")
+    args = parser.parse_args(argv)
+
+    report = soak(args.hours, args.interval, args.fps, args.tick_rate, args.realtime, not args.no_tracemalloc,
+                  args.warmup, args.max_growth, args.restarts, args.max_game)
+    with open(args.out, "w", encoding = "utf-8") as f:
+        json.dump(report, f, ensure_ascii = False, indent = 2)
+
+    print(f"{report['frames']}프레임, 게임 {report['games']} -> {args.out}")
+    for key, result in report["trends"].items():
+        if result is not None:
+            print(f"  {key:14} {result['per_hour']:>+12.2f}/h  ({result['rel_per_hour'] * 100:+.2f}%/h)")
+    for site in report.get("growth_sites", [])[:5]:
+        print(f"  +{site['size_diff_kib']:>8.1f} KiB  {site['site']}")
+    for flag in report["flags"]:
+        print(f"FLAG {flag}")
+    sys.exit(1 if report["flags"] else 0)
+
+if __name__ == "__main__":
+    main()
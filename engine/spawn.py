@@ -0,0 +1,28 @@
+import numpy as np
+
+class SpawnStream:
+    def __init__(self, x_range, seed = None, block = 256):
+        self.x_lo, self.x_hi = x_range
+        self.block = block
+        self.reseed(seed)
+
+    def reseed(self, seed):
+        self.rng = np.random.default_rng(seed)
+        self._xs = np.empty(0)
+        self._us = np.empty(0)
+        self._pos = 0
+
+    def _refill(self, n):
+        size = max(self.block, n)
+        rest = slice(self._pos, None)
+        self._xs = np.concatenate((self._xs[rest], self.rng.integers(self.x_lo, self.x_hi, size, endpoint = True).astype(float)))
+        self._us = np.concatenate((self._us[rest], self.rng.random(size)))
+        self._pos = 0
+
+    def take(self, n, speed_range):
+        if self._pos + n > len(self._xs):
+            self._refill(n)
+        i = self._pos
+        self._pos += n
+        lo, hi = speed_range
+        return self._xs[i:i + n], lo + (hi - lo) * self._us[i:i + n]
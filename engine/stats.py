@@ -0,0 +1,203 @@
+import os
+import json
+import time
+import queue
+import struct
+import argparse
+import threading
+from collections import namedtuple
+from engine.replay import MODES, scene_result
+
+MAGIC = b"PTST"
+VERSION = 1
+INDEX_VERSION = 2
+HEADER = struct.Struct("<4sB")
+RECORD = struct.Struct("<dBIHdQB")
+STATS_DIR = "./stats"
+FSYNC_POLICIES = ("always", "batch", "never")
+
+GameRecord = namedtuple("GameRecord", "time mode score level elapsed seed finished")
+
+def _rank(record):
+    return (-record.score, -record.level, record.time)
+
+def _insert(top, record, n):
+    if not record.finished:
+        return
+    top.append(record)
+    top.sort(key = _rank)
+    del top[n:]
+
+def pack_record(record):
+    return RECORD.pack(record.time, MODES.index(record.mode), record.score, record.level,
+                       record.elapsed, record.seed, record.finished)
+
+def unpack_record(data, offset = 0):
+    t, mode, score, level, elapsed, seed, finished = RECORD.unpack_from(data, offset)
+    return GameRecord(t, MODES[mode], score, level, elapsed, seed, bool(finished))
+
+def read_history(path, start = 0):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    if len(data) < HEADER.size or HEADER.unpack_from(data) != (MAGIC, VERSION):
+        return []
+    count = (len(data) - HEADER.size) // RECORD.size
+    return [unpack_record(data, HEADER.size + i * RECORD.size) for i in range(start, count)]
+
+class StatsStore:
+    def __init__(self, directory = STATS_DIR, top_n = 10, batch_size = 16, flush_interval = 2.0, fsync = "batch"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync 정책은 {', '.join(FSYNC_POLICIES)} 중 하나여야 합니다")
+        os.makedirs(directory, exist_ok = True)
+        self.history_path = os.path.join(directory, "history.bin")
+        self.index_path = os.path.join(directory, "top.json")
+        self.top_n = top_n
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._disk_tops, self._written = self._load_index()
+        self.tops = {mode: list(top) for mode, top in self._disk_tops.items()}
+        self._last = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target = self._run, name = "stats-writer", daemon = True)
+        self._thread.start()
+
+    def _load_index(self):
+        tops, written = {mode: [] for mode in MODES}, 0
+        try:
+            with open(self.index_path, encoding = "utf-8") as f:
+                index = json.load(f)
+            if index["version"] == INDEX_VERSION and index["top_n"] == self.top_n:
+                tops = {mode: [GameRecord(*r) for r in index["top"].get(mode, [])] for mode in MODES}
+                written = index["records"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        try:
+            on_disk = max(0, (os.path.getsize(self.history_path) - HEADER.size) // RECORD.size)
+        except OSError:
+            on_disk = 0
+        if written > on_disk:
+            tops, written = {mode: [] for mode in MODES}, 0
+        if written < on_disk:
+            for record in read_history(self.history_path, written):
+                _insert(tops[record.mode], record, self.top_n)
+            written = on_disk
+        return tops, written
+
+    def top(self, mode):
+        with self._lock:
+            return list(self.tops[mode])
+
+    def best(self, mode):
+        top = self.top(mode)
+        return top[0] if top else None
+
+    def add(self, mode, result, seed = 0, finished = True):
+        record = GameRecord(time.time(), mode, int(result["score"]), int(result["level"]),
+                            float(result["elapsed"]), seed, bool(finished))
+        with self._lock:
+            _insert(self.tops[mode], record, self.top_n)
+        self._queue.put(record)
+        return record
+
+    def track(self, mode, scene, leaving = False):
+        key = (mode, scene.seed)
+        if key == self._last:
+            return None
+        if not scene.game_over and not (leaving and scene.elapsed > 0.0):
+            return None
+        self._last = key
+        return self.add(mode, scene_result(scene), scene.seed, scene.game_over)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch, stop = [self._queue.get()], False
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout = timeout))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                stop = True
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, records):
+        new_file = not os.path.exists(self.history_path) or os.path.getsize(self.history_path) < HEADER.size
+        with open(self.history_path, "wb" if new_file else "ab") as f:
+            if new_file:
+                f.write(HEADER.pack(MAGIC, VERSION))
+                self._written = 0
+            for record in records:
+                f.write(pack_record(record))
+                if self.fsync == "always":
+                    f.flush()
+                    os.fsync(f.fileno())
+            if self.fsync == "batch":
+                f.flush()
+                os.fsync(f.fileno())
+        self._written += len(records)
+
+        for record in records:
+            _insert(self._disk_tops[record.mode], record, self.top_n)
+        self._write_index()
+
+    def _write_index(self):
+        index = {
+            "version": INDEX_VERSION,
+            "top_n": self.top_n,
+            "records": self._written,
+            "top": {mode: [list(r) for r in top] for mode, top in self._disk_tops.items()},
+        }
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding = "utf-8") as f:
+            json.dump(index, f, ensure_ascii = False)
+            if self.fsync != "never":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, self.index_path)
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "모드별 최고 기록 보기")
+    parser.add_argument("--dir", default = STATS_DIR)
+    parser.add_argument("--top", type = int, default = 10)
+    parser.add_argument("--rebuild", action = "store_true", help = "색인을 버리고 전체 기록에서 다시 만듭니다")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        try:
+            os.remove(os.path.join(args.dir, "top.json"))
+        except OSError:
+            pass
+    start = time.perf_counter()
+    store = StatsStore(args.dir, top_n = args.top)
+    ms = (time.perf_counter() - start) * 1000.0
+    if args.rebuild:
+        store._write_index()
+    store.close()
+    print(f"{store._written}판 기록, 색인 로드 {ms:.1f} ms")
+    for mode in MODES:
+        print(f"[{mode}]")
+        for i, r in enumerate(store.top(mode), 1):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(r.time))
+            print(f"{i:>3}. {r.score:>6}  Lv.{r.level:<3} {r.elapsed:>8.2f}초  {when}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import multiprocessing
+import numpy as np
+from engine.timestep import TICK_RATE
+from engine.difficulty import merge_difficulty
+
+def _init_worker():
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    from engine.headless import init_display
+    init_display(600, 800)
+
+def _play_chunk(task):
+    from main import SCENES
+    from engine.bots import BOTS
+    from engine.headless import HeadlessRunner
+
+    mode, index, config, seeds, seconds, dt = task
+    results = []
+    for seed in seeds:
+        runner = HeadlessRunner(SCENES[mode], dt = dt, bot = BOTS[mode](), seed = seed, difficulty = config)
+        result = runner.run(seconds)
+        results.append((result["elapsed"], result["score"], result["level"], result["game_over"]))
+    return index, results
+
+def parse_value(text):
+    if ":" in text:
+        return tuple(int(v) for v in text.split(":"))
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def parse_grid(items):
+    grid = {}
+    for item in items:
+        key, sep, values = item.partition("=")
+        if not sep or not key or not values:
+            raise ValueError(f"그리드 항목은 이름=값,값 형식이어야 합니다: '{item}'")
+        grid[key] = [parse_value(v) for v in values.split(",")]
+    return grid
+
+def expand(grid):
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+def distribution(values):
+    arr = np.asarray(values, dtype = float)
+    p10, p50, p90 = np.percentile(arr, (10, 50, 90))
+    return {
+        "mean": round(float(arr.mean()), 3),
+        "std": round(float(arr.std()), 3),
+        "p10": round(float(p10), 3),
+        "p50": round(float(p50), 3),
+        "p90": round(float(p90), 3),
+        "max": round(float(arr.max()), 3),
+    }
+
+def summarize(config, results):
+    elapsed, score, level, over = zip(*results)
+    return {
+        "config": {k: list(v) if isinstance(v, tuple) else v for k, v in config.items()},
+        "games": len(results),
+        "game_over_rate": round(sum(over) / len(results), 4),
+        "survival_s": distribution(elapsed),
+        "score": distribution(score),
+        "level": distribution(level),
+    }
+
+def sweep(mode, configs, games, seconds = 300.0, dt = 1 / TICK_RATE, workers = None, chunk = 25, base_seed = 0):
+    tasks = []
+    for index, config in enumerate(configs):
+        for start in range(0, games, chunk):
+            seeds = range(base_seed + start, base_seed + min(start + chunk, games))
+            tasks.append((mode, index, config, list(seeds), seconds, dt))
+
+    collected = [[] for _ in configs]
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers or os.cpu_count(), initializer = _init_worker) as pool:
+        for done, (index, results) in enumerate(pool.imap_unordered(_play_chunk, tasks), 1):
+            collected[index].extend(results)
+            print(f"\r{done}/{len(tasks)} chunks", end = "", file = sys.stderr, flush = True)
+        pool.close()
+        pool.join()
+    print(file = sys.stderr)
+    return [summarize(config, results) for config, results in zip(configs, collected)]
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "난이도 파라미터 그리드를 봇으로 병렬 시뮬레이션합니다.")
+    parser.add_argument("scene", choices = ("dodge", "catch"))
+    parser.add_argument("grid", nargs = "*", help = "예: spawn_interval=0.5,0.7 speed_range=280:600,320:700 interval_scale=0.85,0.9")
+    parser.add_argument("--games", type = int, default = 200, help = "설정마다 돌릴 판 수")
+    parser.add_argument("--seconds", type = float, default = 300.0, help = "한 판 최대 길이")
+    parser.add_argument("--dt", type = float, default = 1 / TICK_RATE)
+    parser.add_argument("--workers", type = int, default = None)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--out", default = "sweep.json")
+    args = parser.parse_args(argv)
+
+    from main import SCENES
+
+    try:
+        configs = expand(parse_grid(args.grid))
+        for config in configs:
+            merge_difficulty(SCENES[args.scene].DIFFICULTY, config)
+    except ValueError as e:
+        parser.error(str(e))
+    start = time.perf_counter()
+    summaries = sweep(args.scene, configs, args.games, args.seconds, args.dt, args.workers, base_seed = args.seed)
+    report = {
+        "scene": args.scene,
+        "games_per_config": args.games,
+        "seconds": args.seconds,
+        "dt": args.dt,
+        "wall_s": round(time.perf_counter() - start, 2),
+        "results": summaries,
+    }
+    with open(args.out, "w", encoding = "utf-8") as f:
+        json.dump(report, f, indent = 2, ensure_ascii = False)
+    for s in summaries:
+        print(f"{json.dumps(s['config'], ensure_ascii = False)}  survival p50={s['survival_s']['p50']}s  score p50={s['score']['p50']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    def __init__(self, font, maxsize = 64):
+        self.font = font
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def render(self, text, color, antialias = True):
+        key = (text, color, antialias)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            return surf
+        surf = self.font.render(text, antialias, color)
+        self._cache[key] = surf
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last = False)
+        return surf
+
+    def clear(self):
+        self._cache.clear()
+
+class DigitAtlas:
+    def __init__(self, font, color, chars = "0123456789.-s"):
+        self.glyphs = {c: font.render(c, True, color) for c in chars}
+        self.height = max(g.get_height() for g in self.glyphs.values())
+        self.max_width = max(g.get_width() for g in self.glyphs.values())
+
+    def width(self, text):
+        return sum(self.glyphs[c].get_width() for c in text)
+
+    def draw(self, surface, text, pos):
+        x, y = pos
+        for c in text:
+            glyph = self.glyphs[c]
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return x
+
+class HudField:
+    def __init__(self, font, label, color, atlas, fmt = "{}", max_chars = 10):
+        self.label = font.render(label, True, color)
+        self.atlas = atlas
+        self.fmt = fmt
+        width = self.label.get_width() + atlas.max_width * max_chars
+        height = max(self.label.get_height(), atlas.height)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._text = None
+
+    def draw(self, surface, pos, value):
+        text = self.fmt.format(value)
+        if text != self._text:
+            self._text = text
+            self.surface.fill((0, 0, 0, 0))
+            self.surface.blit(self.label, (0, 0))
+            self.atlas.draw(self.surface, text, (self.label.get_width(), 0))
+            surface.changed(self.surface)
+        return surface.blit(self.surface, pos)
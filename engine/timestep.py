@@ -0,0 +1,22 @@
+TICK_RATE = 120
+
+class FixedStep:
+    def __init__(self, tick_rate = TICK_RATE, max_frame = 0.25):
+        self.dt = 1.0 / tick_rate
+        self.max_frame = max_frame
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        if frame_dt > self.max_frame:
+            frame_dt = self.dt
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+import pygame
+
+class WidgetCache:
+    def __init__(self, maxsize = 32):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def get(self, key, bake):
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            return surf
+        surf = self._cache[key] = bake(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last = False)
+        return surf
+
+    def clear(self):
+        self._cache.clear()
+
+class Toast:
+    def __init__(self, font, color = (255, 255, 255), fill = (20, 20, 20, 170), border = (255, 255, 255), pad = (12, 6), radius = 12, maxsize = 16):
+        self.font = font
+        self.color = color
+        self.fill = fill
+        self.border = border
+        self.pad = pad
+        self.radius = radius
+        self.cache = WidgetCache(maxsize)
+
+    def _bake(self, text):
+        msg = self.font.render(text, True, self.color)
+        card = msg.get_rect().inflate(*self.pad)
+        card.topleft = (0, 0)
+        surf = pygame.Surface(card.size, pygame.SRCALPHA)
+        surf.fill(self.fill)
+        pygame.draw.rect(surf, self.border, card, 2, border_radius = self.radius)
+        surf.blit(msg, msg.get_rect(center = card.center))
+        return surf
+
+    def draw(self, screen, text, center):
+        image = self.cache.get(text, self._bake)
+        return screen.blit(image, image.get_rect(center = center))
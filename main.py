@@ -1,7 +1,15 @@
-import pygame, sys
+import pygame, os, sys, time, argparse
 from scenes.menu import MainMenuScene
 from scenes.dodge import DodgeScene
 from scenes.catch import CatchScene
+from engine.canvas import Canvas, DirtyCanvas, TextureCanvas
+from engine.timestep import FixedStep, TICK_RATE
+from engine.profiler import Profiler
+from engine.governor import FrameGovernor
+from engine.pipeline import SimWorker
+from engine.stats import StatsStore, STATS_DIR
+from engine.loader import SceneLoader
+from engine.replay import Replay, ReplayRecorder, ReplayInput
 
 SCENES = {
     "menu": MainMenuScene,
@@ -9,35 +17,208 @@ SCENES = {
     "catch": CatchScene,
 }
 
-def main():
+GAME_SCENES = ("dodge", "catch")
+LOADER_POLL_MS = 10
+
+def enter_scene(instances, name, W, H, input_source = None, loader = None):
+    scene = instances.get(name)
+    if scene is None and loader is not None:
+        scene = loader.take(name)
+        if scene is not None:
+            instances[name] = scene
+            return scene
+    if scene is None:
+        if name in GAME_SCENES:
+            scene = instances[name] = SCENES[name](W, H, input_source = input_source)
+        else:
+            scene = instances[name] = SCENES[name](W, H, loader = loader)
+    else:
+        scene.reset()
+    return scene
+
+def simulate(name, scene, stepper, frame_dt, recorder = None, record_dir = None, stats = None):
+    recording = recorder is not None and getattr(scene, "input", None) is recorder
+    if recording:
+        recorder.track(name, scene, record_dir)
+    for _ in range(stepper.advance(frame_dt)):
+        scene.update(stepper.dt)
+        if scene.next_scene:
+            break
+    if recording:
+        recorder.track(name, scene, record_dir)
+    if stats is not None and name in GAME_SCENES:
+        stats.track(name, scene)
+    return stepper.alpha
+
+def simulate_frame(name, scene, stepper, frame_dt, recorder = None, record_dir = None, stats = None):
+    alpha = simulate(name, scene, stepper, frame_dt, recorder, record_dir, stats)
+    return scene.snapshot(), alpha
+
+def parse_args(argv = None):
+    parser = argparse.ArgumentParser(description = "감자 게임")
+    parser.add_argument("--dirty", action = "store_true", help = "바뀐 영역만 다시 그려서 화면에 올립니다")
+    parser.add_argument("--backend", choices = ("surface", "texture"), default = "surface", help = "surface: 소프트웨어 blit, texture: SDL Renderer/Texture (GPU가 없으면 소프트웨어 렌더러)")
+    parser.add_argument("--fps", type = int, default = 60, help = "화면 갱신 상한")
+    parser.add_argument("--fixed-fps", action = "store_true", help = "게임 중 프레임 비용에 따라 fps를 낮추지 않습니다")
+    parser.add_argument("--idle-timeout", type = int, default = 1000, help = "정적인 화면에서 입력을 기다리는 최대 시간(ms)")
+    parser.add_argument("--pipelined", action = "store_true", help = "다음 틱 시뮬레이션을 별도 스레드에서 돌리면서 이전 틱을 그립니다")
+    parser.add_argument("--no-preload", action = "store_true", help = "메뉴에서 게임 장면을 미리 불러오지 않음")
+    parser.add_argument("--tick-rate", type = int, default = TICK_RATE, help = "초당 시뮬레이션 틱 수")
+    parser.add_argument("--record", metavar = "DIR", default = None, help = "게임마다 리플레이(.ptr)를 DIR에 저장")
+    parser.add_argument("--replay", metavar = "FILE", default = None, help = "리플레이를 실시간으로 재생")
+    parser.add_argument("--stats", metavar = "DIR", default = STATS_DIR, help = "게임 기록과 모드별 최고 기록 색인을 저장할 폴더")
+    parser.add_argument("--no-stats", action = "store_true", help = "게임 기록을 저장하지 않음")
+    parser.add_argument("--profile", metavar = "PATH", default = None, help = "프레임 트레이스를 기록해 종료 시 저장 (.json 또는 .csv)")
+    return parser.parse_args(argv)
+
+def main(argv = None):
+    args = parse_args(argv)
+    replay = Replay.load(args.replay) if args.replay else None
+    if replay is not None:
+        args.tick_rate = replay.tick_rate
+    recorder = None
+    if args.record:
+        os.makedirs(args.record, exist_ok = True)
+        recorder = ReplayRecorder(tick_rate = args.tick_rate)
+
     pygame.init()
     W, H = 600, 800
-    FPS = 60
 
-    screen = pygame.display.set_mode((W, H))
-    pygame.display.set_caption("감자 게임")
+    if args.backend == "texture":
+        pygame.display.set_mode((W, H), pygame.HIDDEN)
+        canvas = TextureCanvas((W, H), "감자 게임")
+    else:
+        screen = pygame.display.set_mode((W, H))
+        pygame.display.set_caption("감자 게임")
+        canvas = DirtyCanvas(screen) if args.dirty else Canvas(screen)
     clock = pygame.time.Clock()
-    dt = 0.0
+    stepper = FixedStep(args.tick_rate)
+    frame_dt = 0.0
+    profiler = Profiler(budget_ms = 1000 / args.fps)
+    governor = FrameGovernor(args.fps)
+    worker = SimWorker() if args.pipelined else None
+    stats = None if args.no_stats or replay is not None else StatsStore(args.stats)
+    if args.profile:
+        profiler.start_trace()
 
-    current = SCENES["menu"](W, H)
+    instances = {}
+    loader = None
+    if replay is not None:
+        name = replay.mode
+        current = SCENES[name](W, H, input_source = ReplayInput(replay), seed = replay.seed)
+    else:
+        name = "menu"
+        if not args.no_preload:
+            loader = SceneLoader()
+        current = enter_scene(instances, name, W, H, loader = loader)
+        if loader is not None:
+            for scene_name in GAME_SCENES:
+                loader.preload(scene_name, SCENES[scene_name], W, H, input_source = recorder)
 
     running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            current.handle_event(event)
+    redraw = True
+    was_static = False
+    try:
+        while running:
+            profiler.begin_frame()
+            if worker is not None and worker.busy:
+                with profiler.section("update"):
+                    worker.collect()
+            if loader is not None:
+                with profiler.section("update"):
+                    loader.pump()
+            static = getattr(current, "static", False)
+            if static and not was_static:
+                redraw = True
+            was_static = static
+            idle = static and not profiler.overlay
+            if idle and not redraw and not getattr(current, "dirty", False) and not pygame.event.peek():
+                with profiler.section("wait"):
+                    loading = loader is not None and loader.busy
+                    event = pygame.event.wait(LOADER_POLL_MS if loading else args.idle_timeout)
+                    if event.type != pygame.NOEVENT:
+                        pygame.event.post(event)
+            governor.begin_frame()
+
+            with profiler.section("events"):
+                for event in pygame.event.get():
+                    if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                        running = False
+                    elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                        redraw = True
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                        redraw = True
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                        if profiler.tracing:
+                            profiler.stop_trace(time.strftime("trace_%Y%m%d_%H%M%S.json"))
+                        else:
+                            profiler.start_trace()
+                    current.handle_event(event)
 
-        current.update(dt)
-        current.draw(screen)
-        pygame.display.flip()
+            if idle and getattr(current, "static", False) and not current.next_scene:
+                stepper.reset()
+                if worker is not None:
+                    worker.prime(None)
+                if redraw or getattr(current, "dirty", False):
+                    with profiler.section("draw"):
+                        current.draw(canvas, 1.0)
+                    with profiler.section("present"):
+                        canvas.present(full = redraw)
+                    redraw = False
+                with profiler.section("wait"):
+                    clock.tick()
+                frame_dt = 0.0
+                profiler.end_frame()
+                continue
 
-        if getattr(current, "next_scene", None):
-            name = current.next_scene
-            current = SCENES[name](W, H)
+            pipelined = worker is not None and hasattr(current, "snapshot") and not current.next_scene
+            if pipelined:
+                if worker.frame is None:
+                    worker.prime((current.snapshot(), stepper.alpha))
+                frame = worker.frame
+                worker.submit(simulate_frame, name, current, stepper, frame_dt, recorder, args.record, stats)
+            else:
+                with profiler.section("update"):
+                    simulate(name, current, stepper, frame_dt, recorder, args.record, stats)
+            with profiler.section("draw"):
+                if pipelined:
+                    current.render(canvas, *frame)
+                else:
+                    current.draw(canvas, stepper.alpha)
+                profiler.draw(canvas)
+            with profiler.section("present"):
+                canvas.present()
+            redraw = False
 
-        dt = clock.tick(FPS) / 1000.0
+            switching = current.next_scene and not (loader is not None and loader.loading(current.next_scene))
+            if switching and not (worker is not None and worker.busy):
+                if stats is not None and name in GAME_SCENES:
+                    stats.track(name, current, leaving = True)
+                name = current.next_scene
+                current = enter_scene(instances, name, W, H, recorder, loader)
+                canvas.invalidate()
+                stepper.reset()
+                governor.reset()
+                if worker is not None:
+                    worker.prime(None)
+                redraw = True
 
+            fps = args.fps if args.fixed_fps or name not in GAME_SCENES else governor.end_frame()
+            with profiler.section("wait"):
+                frame_dt = clock.tick(fps) / 1000.0
+            profiler.end_frame()
+    finally:
+        if loader is not None:
+            loader.close()
+        if worker is not None:
+            worker.close()
+        if stats is not None:
+            if name in GAME_SCENES:
+                stats.track(name, current, leaving = True)
+            stats.close()
+        if args.profile:
+            profiler.export(args.profile)
     pygame.quit()
     sys.exit()
 
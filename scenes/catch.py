@@ -1,48 +1,55 @@
 import pygame
 import random
+from collections import namedtuple
+from engine.potato_store import PotatoStore, interpolate
+from engine.spawn import SpawnStream
+from engine.input import KeyboardInput
+from engine.assets import assets
+from engine.difficulty import merge_difficulty
+from engine.text import DigitAtlas, HudField
+from engine.batch import SpriteBatch
+from engine.panel import GameOverPanel
+from engine.widgets import Toast
+
+CatchFrame = namedtuple("CatchFrame", "potatoes bucket level score lives elapsed toast game_over")
 
 class BackGround:
     def __init__(self, image):
         self.image = image
         
     def draw(self, surface):
-        surface.blit(self.image, (0, 0))
+        surface.background(self.image)
 
 class Bucket:
     def __init__(self, image, x, y, speed = 520, world_w = 600):
         self.image = image
         self.rect = self.image.get_rect(center = (x, y))
+        self.x = self.prev_x = float(self.rect.x)
         self.speed = speed
         self.world_w = world_w
 
+    def place(self, center):
+        self.rect.center = center
+        self.x = self.prev_x = float(self.rect.x)
+
     def update(self, dt, keys):
+        self.prev_x = self.x
         if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed * dt
+            self.x -= self.speed * dt
         elif keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed * dt
-        if self.rect.left < 0: self.rect.left = 0
-        if self.rect.right > self.world_w: self.rect.right = self.world_w
-
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
-
-class Potato:
-    def __init__(self, image, speed, x, y = -60):
-        self.image = image
-        self.rect = self.image.get_rect(midtop = (x, y))
-        self.speed = speed
+            self.x += self.speed * dt
+        self.x = min(max(self.x, 0.0), float(self.world_w - self.rect.width))
+        self.rect.x = round(self.x)
 
-    def update(self, dt):
-        self.rect.y += self.speed * dt
-
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def snapshot(self):
+        return self.image, self.prev_x, self.x, self.rect.y
 
-    def is_out(self, H) -> bool:
-        return self.rect.top > H
+    def draw(self, batch, alpha = 1.0, frame = None):
+        image, prev_x, x, y = self.snapshot() if frame is None else frame
+        batch.add(image, (round(prev_x + (x - prev_x) * alpha), y))
 
 class PotatoManager:
-    def __init__(self, image, W, H, spawn_interval = 1.0, speed_range = (280, 600), spawn_count = 1, max_count = 100):
+    def __init__(self, image, W, H, spawn_interval = 1.0, speed_range = (280, 600), spawn_count = 1, max_count = 100, seed = None):
         self.image = image
         self.W, self.H = W, H
         self.spawn_interval = spawn_interval
@@ -50,7 +57,8 @@ class PotatoManager:
         self.spawn_count = spawn_count
         self.max_count = max_count
         self.timer = 0.0
-        self.potatoes: list[Potato] = []
+        self.stream = SpawnStream((25, W - 25), seed)
+        self.potatoes = PotatoStore(*image.get_size(), capacity = max_count)
 
     def update(self, dt):
         dt = min(dt, 0.05)
@@ -59,104 +67,122 @@ class PotatoManager:
             self._spawn_batch(self.spawn_count)
             self.timer -= self.spawn_interval
 
-        for p in self.potatoes:
-            p.update(dt)
-
-        missed = 0
-        kept = []
-        for p in self.potatoes:
-            if p.is_out(self.H):
-                missed += 1
-            else:
-                kept.append(p)
-        self.potatoes = kept
-        return missed
+        self.potatoes.step(dt)
+        return self.potatoes.kill_below(self.H)
     
     def _spawn_batch(self, n):
-        for _ in range(n):
-            if len(self.potatoes) >= self.max_count:
-                break
-            self.spawn()
+        n = min(n, self.max_count - len(self.potatoes))
+        if n > 0:
+            self.spawn(n)
 
-    def spawn(self):
-        x = random.randint(25, self.W - 25)
-        speed = random.uniform(*self.speed_range)
-        self.potatoes.append(Potato(self.image, speed, x))
+    def spawn(self, n = 1):
+        xs, speeds = self.stream.take(n, self.speed_range)
+        self.potatoes.add_many(xs, speeds)
 
-    def draw(self, surface):
-        for p in self.potatoes:
-            p.draw(surface)
+    def snapshot(self):
+        return self.potatoes.snapshot()
+
+    def draw(self, batch, alpha = 1.0, frame = None):
+        batch.add_many(self.image, self.potatoes.coords(alpha) if frame is None else interpolate(frame, alpha))
+
+    def catch(self, rect):
+        return self.potatoes.kill_hit(rect)
+
+    def reseed(self, seed):
+        self.stream.reseed(seed)
 
     def clear(self):
         self.potatoes.clear()
         self.timer = 0.0
 
 class CatchScene:
-    def __init__(self, W, H):
+    IMAGES = (
+        ("./images/background.png", None, False),
+        ("./images/bucket.png", (70, 48), True),
+        ("./images/potato.png", (29, 24), True),
+    )
+    FONTS = (36, 80, 28)
+    DIFFICULTY = {
+        "spawn_interval": 1.0,
+        "speed_range": (280, 600),
+        "spawn_count": 1,
+        "max_count": 100,
+        "level_time": 10.0,
+        "interval_scale": 0.92,
+        "min_interval": 0.55,
+        "speed_step": (15, 30),
+        "speed_cap": (900, 1200),
+        "count_every": 3,
+        "max_spawn_count": 3,
+    }
+
+    def __init__(self, W, H, input_source = None, seed = None, difficulty = None):
         self.W, self.H = W, H
+        self.difficulty = merge_difficulty(self.DIFFICULTY, difficulty)
         self.next_scene = None
+        self.input = input_source or KeyboardInput()
 
-        self.background_image = pygame.image.load("./images/background.png").convert()
-        self.bucket_image = pygame.transform.scale(pygame.image.load("./images/bucket.png").convert_alpha(), (70, 48))
-        self.potato_image = pygame.transform.scale(pygame.image.load("./images/potato.png").convert_alpha(), (29, 24))
+        self.background_image, self.bucket_image, self.potato_image = (assets.image(*spec) for spec in self.IMAGES)
 
         self.background = BackGround(self.background_image)
         self.bucket = Bucket(self.bucket_image, W / 2, H - 120, world_w = W)
 
         self.manager = PotatoManager(
             self.potato_image, W, H,
-            spawn_interval = 1.0,
-            speed_range = (280, 600),
-            spawn_count = 1,
-            max_count = 100
+            spawn_interval = self.difficulty["spawn_interval"],
+            speed_range = self.difficulty["speed_range"],
+            spawn_count = self.difficulty["spawn_count"],
+            max_count = self.difficulty["max_count"]
         )
         self._base_spawn_interval = self.manager.spawn_interval
         self._base_speed_range = self.manager.speed_range
         self._base_spawn_count = self.manager.spawn_count
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.manager.reseed(self.seed)
 
-        try:
-            self.font = pygame.font.Font("./fonts/PretendardVariable.ttf", 36)
-            self.title_font = pygame.font.Font("./fonts/PretendardVariable.ttf", 80)
-            self.hint_font = pygame.font.Font("./fonts/PretendardVariable.ttf", 28)
-        except FileNotFoundError:
-            self.font = pygame.font.SysFont(None, 36)
-            self.title_font = pygame.font.SysFont(None, 80)
-            self.hint_font = pygame.font.SysFont(None, 28)
+        self.font, self.title_font, self.hint_font = (assets.font(size) for size in self.FONTS)
 
         self.hint = self.font.render("ESC : 메뉴로", True, (0, 0, 0))
+        self.batch = SpriteBatch()
+        self.toast = Toast(self.font)
+        hud_digits = DigitAtlas(self.font, (20, 20, 20))
+        self.hud_level = HudField(self.font, "현재 레벨 : ", (20, 20, 20), hud_digits)
+        self.hud_score = HudField(self.font, "받은 개수 : ", (20, 20, 20), hud_digits)
+        self.hud_time = HudField(self.font, "생존 시간 : ", (20, 20, 20), hud_digits, fmt = "{:.2f}s")
+        self.game_over_panel = GameOverPanel(W, H, (540, 360), self.title_font, self.font, self.hint_font)
         self._dt_cap = 0.05
 
         self.score = 0
         self.lives = 3
         self.elapsed = 0.0
         self.game_over = False
-        self._modal_shown = False
-        self._ignore_next_dt = False
 
         self.level = 1
-        self._next_level_at = 10.0
+        self._next_level_at = self.difficulty["level_time"]
         self._toast_timer = 0.0
         self._toast_text = ""
 
-        for _ in range(3):
-            self.manager.spawn()
+        self.manager.spawn(3)
+
+    @property
+    def static(self):
+        return self.game_over
 
     def handle_event(self, event):
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.next_scene = "menu"
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.next_scene = "menu"
+            elif event.key == pygame.K_r and self.game_over:
+                self.reset()
 
     def update(self, dt):
         if self.game_over:
             return
 
-        if self._ignore_next_dt:
-            dt = 0.0
-            self._ignore_next_dt = False
-
         if self._toast_timer > 0.0:
             self._toast_timer = max(self._toast_timer - dt, 0.0)
 
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         self.bucket.update(min(dt, self._dt_cap), keys)
 
         added_missed = self.manager.update(dt)
@@ -170,126 +196,79 @@ class CatchScene:
         if added_missed:
             self.lives -= added_missed
 
-        caught, kept = 0, []
         bucket_hitbox = self.bucket.rect.inflate(20, 10)
-        for p in self.manager.potatoes:
-            if p.rect.colliderect(bucket_hitbox):
-                caught += 1
-            else:
-                kept.append(p)
-        self.manager.potatoes = kept
-        self.score += caught
+        self.score += self.manager.catch(bucket_hitbox)
 
         self.elapsed += dt
 
         if self.elapsed >= self._next_level_at:
+            d = self.difficulty
             self.level += 1
-            self._next_level_at += 10.0
+            self._next_level_at += d["level_time"]
 
-            self.manager.spawn_interval = max(0.55, self.manager.spawn_interval * 0.92)
+            self.manager.spawn_interval = max(d["min_interval"], self.manager.spawn_interval * d["interval_scale"])
             lo, hi = self.manager.speed_range
-            lo = int(min(lo + 15, 900))
-            hi = int(min(hi + 30, 1200))
+            lo = int(min(lo + d["speed_step"][0], d["speed_cap"][0]))
+            hi = int(min(hi + d["speed_step"][1], d["speed_cap"][1]))
             self.manager.speed_range = (lo, hi)
 
-            if self.level % 3 == 0:
-                self.manager.spawn_count = min(self.manager.spawn_count + 1, 3)
+            if d["count_every"] and self.level % d["count_every"] == 0:
+                self.manager.spawn_count = min(self.manager.spawn_count + 1, d["max_spawn_count"])
 
             self._toast_text = f"난이도 상승! Lv.{self.level}"
             self._toast_timer = 1.5
 
-    def draw(self, screen):
+    def snapshot(self):
+        return CatchFrame(
+            self.manager.snapshot(), self.bucket.snapshot(),
+            self.level, self.score, self.lives, self.elapsed,
+            self._toast_text if self._toast_timer > 0.0 else "", self.game_over,
+        )
+
+    def draw(self, screen, alpha = 1.0):
+        self.render(screen, self.snapshot(), alpha)
+
+    def render(self, screen, frame, alpha = 1.0):
         self.background.draw(screen)
-        self.manager.draw(screen)
-        self.bucket.draw(screen)
+        self.manager.draw(self.batch, alpha, frame.potatoes)
+        self.bucket.draw(self.batch, alpha, frame.bucket)
+        self.batch.flush(screen)
 
         hud_left, hud_top, gap = 12, 12, 40
-        txt_level = self.font.render(f"현재 레벨 : {self.level}", True, (20, 20, 20))
-        txt_score = self.font.render(f"받은 개수 : {self.score}", True, (20, 20, 20))
-        txt_time  = self.font.render(f"생존 시간 : {self.elapsed:.2f}s", True, (20, 20, 20))
         screen.blit(self.hint, (hud_left, hud_top))
-        screen.blit(txt_level, (hud_left, hud_top + gap))
-        screen.blit(txt_score,  (hud_left, hud_top + gap * 2))
-        screen.blit(txt_time, (hud_left, hud_top + gap * 3))
-        self._draw_lives(screen)
-
-        if self._toast_timer > 0.0 and self._toast_text:
-            self._draw_toast(screen, self._toast_text, y = 90)
-
-        if self.game_over and not self._modal_shown:
-            self._modal_shown = True
-            self._run_game_over_modal(screen)
-
-    def _draw_lives(self, screen):
+        self.hud_level.draw(screen, (hud_left, hud_top + gap), frame.level)
+        self.hud_score.draw(screen, (hud_left, hud_top + gap * 2), frame.score)
+        self.hud_time.draw(screen, (hud_left, hud_top + gap * 3), frame.elapsed)
+        self._draw_lives(screen, frame.lives)
+
+        if frame.toast:
+            self.toast.draw(screen, frame.toast, (self.W // 2, 90))
+
+        if frame.game_over:
+            self.game_over_panel.show((
+                f"현재 레벨 : {frame.level}",
+                f"받은 개수 : {frame.score}",
+                f"플레이 시간 : {frame.elapsed:.2f}초",
+            ))
+            self.game_over_panel.draw(screen)
+
+    def _draw_lives(self, screen, lives):
         x, y, r, pad = self.W - 20, 20, 10, 26
         for i in range(3):
-            color = (220, 40, 60) if i < self.lives else (200, 200, 200)
-            pygame.draw.circle(screen, color, (x - i * pad, y), r)
-            pygame.draw.circle(screen, (0, 0, 0), (x - i * pad, y), r, 2)
-
-    def _draw_text_center(self, surface, text, font, color, y):
-        s = font.render(text, True, color)
-        rect = s.get_rect(center = (self.W // 2, y))
-        surface.blit(s, rect)
-
-    def _draw_toast(self, screen, text, y = 120):
-        msg = self.font.render(text, True, (255, 255, 255))
-        pad_x, pad_y = 12, 6
-        card = msg.get_rect(center = (self.W // 2, y))
-        card.inflate_ip(pad_x, pad_y)
-
-        overlay = pygame.Surface(card.size, pygame.SRCALPHA)
-        overlay.fill((20, 20, 20, 170))
-        screen.blit(overlay, card.topleft)
-        pygame.draw.rect(screen, (255, 255, 255), card, 2, border_radius = 12)
-        screen.blit(msg, msg.get_rect(center = card.center))
-
-    def _run_game_over_modal(self, screen):
-        overlay = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        screen.blit(overlay, (0, 0))
-
-        card_w, card_h = 540, 360
-        card = pygame.Rect(0, 0, card_w, card_h)
-        card.center = (self.W // 2, self.H // 2)
-        pygame.draw.rect(screen, (245, 245, 245), card, border_radius=18)
-        pygame.draw.rect(screen, (220, 220, 220), card, 2, border_radius=18)
-
-        top = card.top
-        self._draw_text_center(screen, "GAME OVER", self.title_font, (30, 30, 30), top + 70)
-        self._draw_text_center(screen, f"현재 레벨 : {self.level}", self.font, (50, 50, 50), top + 140)
-        self._draw_text_center(screen, f"받은 개수 : {self.score}", self.font, (50, 50, 50), top + 180)
-        self._draw_text_center(screen, f"플레이 시간 : {self.elapsed:.2f}초", self.font, (50, 50, 50), top + 220)
-        self._draw_text_center(screen, "R : 재시작 | ESC : 메뉴", self.hint_font, (90, 90, 90), top + 290)
-        pygame.display.flip()
-
-        clock = pygame.time.Clock()
-        waiting = True
-        while waiting:
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT:
-                    pygame.quit(); raise SystemExit
-                if e.type == pygame.KEYDOWN:
-                    if e.key == pygame.K_r:
-                        self.reset()
-                        self._ignore_next_dt = True
-                        pygame.event.clear()
-                        waiting = False
-                    elif e.key == pygame.K_ESCAPE:
-                        self.next_scene = "menu"
-                        waiting = False
-            clock.tick(60)
-
-    def reset(self):
+            color = (220, 40, 60) if i < lives else (200, 200, 200)
+            screen.circle(color, (x - i * pad, y), r)
+            screen.circle((0, 0, 0), (x - i * pad, y), r, 2)
+
+    def reset(self, seed = None):
+        self.next_scene = None
         self.score = 0
         self.lives = 3
         self.elapsed = 0.0
         self.game_over = False
-        self._modal_shown = False
-        self._ignore_next_dt = False
+        self.game_over_panel.hide()
 
         self.level = 1
-        self._next_level_at = 10.0
+        self._next_level_at = self.difficulty["level_time"]
         self._toast_timer = 0.0
         self._toast_text = ""
 
@@ -297,9 +276,9 @@ class CatchScene:
         self.manager.spawn_interval = self._base_spawn_interval
         self.manager.speed_range = self._base_speed_range
         self.manager.spawn_count = self._base_spawn_count
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.manager.reseed(self.seed)
 
-        for _ in range(3):
-            self.manager.spawn()
+        self.manager.spawn(3)
 
-        self.bucket.rect.centerx = self.W // 2
-        self.bucket.rect.centery = self.H - 80
+        self.bucket.place((self.W // 2, self.H - 120))
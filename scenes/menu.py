@@ -1,36 +1,58 @@
 import pygame
+from engine.assets import assets
+from engine.text import DigitAtlas, HudField
+from engine.widgets import WidgetCache
 
 class Button:
     def __init__(self, rect, text, font):
         self.rect = pygame.Rect(rect)
         self.text_surf = font.render(text, True, (0, 0, 0))
-        self.text_rect = self.text_surf.get_rect(center = self.rect.center)
+        self.images = WidgetCache(2)
 
-    def draw(self, screen):
-        hovered = self.rect.collidepoint(pygame.mouse.get_pos())
-        pygame.draw.rect(screen, (255, 255, 255) if hovered else (210, 210, 210), self.rect, border_radius=12)
-        pygame.draw.rect(screen, (0, 0, 0), self.rect, 2, border_radius = 12)
-        screen.blit(self.text_surf, self.text_rect)
+    def _bake(self, hovered):
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local = surf.get_rect()
+        pygame.draw.rect(surf, (255, 255, 255) if hovered else (210, 210, 210), local, border_radius = 12)
+        pygame.draw.rect(surf, (0, 0, 0), local, 2, border_radius = 12)
+        surf.blit(self.text_surf, self.text_surf.get_rect(center = local.center))
+        return surf
+
+    def draw(self, screen, mouse_pos):
+        hovered = self.rect.collidepoint(mouse_pos)
+        return screen.blit(self.images.get(hovered, self._bake), self.rect)
 
     def clicked(self, event):
         return event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos)
 
 class MainMenuScene:
-    def __init__(self, W, H):
+    static = True
+
+    def __init__(self, W, H, loader = None):
         self.W, self.H = W, H
+        self.loader = loader
         self.next_scene = None
-        try:
-            self.font = pygame.font.Font("./fonts/PretendardVariable.ttf", 48)
-        except FileNotFoundError:
-            self.font = pygame.font.SysFont(None, 48)
+        self.font = assets.font(48)
+        self.hint_font = assets.font(28)
+        digits = DigitAtlas(self.hint_font, (80, 60, 20), chars = "0123456789%")
+        self.hint_text = HudField(self.hint_font, "불러오는 중... ", (80, 60, 20), digits, fmt = "{:.0f}%", max_chars = 4)
 
         self.title = self.font.render("감자 게임", True, (50, 30, 0))
         self.title_rect = self.title.get_rect(center=(W // 2, 200))
         self.btn_dodge = Button((W // 2 - 120, 350, 240, 80), "감자 피하기", self.font)
         self.btn_catch = Button((W // 2 - 120, 470, 240, 80), "감자 받기", self.font)
         self.btn_exit  = Button((W // 2 - 120, 590, 240, 80), "게임 종료", self.font)
+        self.buttons = (self.btn_dodge, self.btn_catch, self.btn_exit)
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.dirty = True
+
+    def _hovered(self, pos):
+        return [b.rect.collidepoint(pos) for b in self.buttons]
 
     def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            if self._hovered(event.pos) != self._hovered(self.mouse_pos):
+                self.dirty = True
+            self.mouse_pos = event.pos
         if self.btn_dodge.clicked(event):
             self.next_scene = "dodge"
         if self.btn_catch.clicked(event):
@@ -39,12 +61,21 @@ class MainMenuScene:
             pygame.quit()
             raise SystemExit
 
+    def reset(self):
+        self.next_scene = None
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.dirty = True
+
     def update(self, dt):
         pass
 
-    def draw(self, screen):
+    def draw(self, screen, alpha = 1.0):
         screen.fill((245, 222, 179))
         screen.blit(self.title, self.title_rect)
-        self.btn_dodge.draw(screen)
-        self.btn_catch.draw(screen)
-        self.btn_exit.draw(screen)
+        for button in self.buttons:
+            button.draw(screen, self.mouse_pos)
+        progress = self.loader.progress(self.next_scene) if self.loader is not None else None
+        if progress is not None and progress < 1.0:
+            rect = self.hint_text.surface.get_rect(center = (self.W // 2, 720))
+            self.hint_text.draw(screen, rect.topleft, progress * 100)
+        self.dirty = False
@@ -0,0 +1,28 @@
+import pytest
+from scenes.dodge import DodgeScene
+from engine.difficulty import merge_difficulty
+from engine.sweep import expand, parse_grid
+
+def test_overrides_replace_defaults():
+    merged = merge_difficulty(DodgeScene.DIFFICULTY, {"spawn_interval": 0.5, "speed_range": [300, 650], "level_time": 8})
+    assert merged["spawn_interval"] == 0.5
+    assert merged["speed_range"] == (300, 650)
+    assert merged["level_time"] == 8
+    assert merged["spawn_count"] == DodgeScene.DIFFICULTY["spawn_count"]
+
+@pytest.mark.parametrize("overrides", [
+    {"spawn_intervl": 0.5},
+    {"speed_range": 300},
+    {"speed_range": (1, 2, 3)},
+    {"spawn_interval": (0.5, 0.7)},
+    {"spawn_count": 2.5},
+])
+def test_bad_overrides_are_rejected(overrides):
+    with pytest.raises(ValueError):
+        merge_difficulty(DodgeScene.DIFFICULTY, overrides)
+
+def test_sweep_grid_configs_validate():
+    for config in expand(parse_grid(["spawn_interval=0.5,0.7", "speed_range=280:600,320:700"])):
+        merge_difficulty(DodgeScene.DIFFICULTY, config)
+    with pytest.raises(ValueError):
+        parse_grid(["spawn_interval"])
@@ -0,0 +1,23 @@
+import time
+import pytest
+from main import SCENES
+from engine.bots import BOTS
+from engine.headless import HeadlessRunner
+
+@pytest.mark.parametrize("mode, expected", [
+    ("dodge", {"ticks": 843, "seed": 1, "elapsed": 7.0167, "level": 1, "score": 26, "game_over": True}),
+    ("catch", {"ticks": 1526, "seed": 1, "elapsed": 12.7083, "level": 2, "score": 11, "game_over": True}),
+])
+def test_headless_seeded_game(mode, expected):
+    results = [HeadlessRunner(SCENES[mode], bot = BOTS[mode](), seed = 1).run(30.0) for _ in range(2)]
+    assert results == [expected, expected]
+
+@pytest.mark.parametrize("mode", ["dodge", "catch"])
+def test_five_minute_game_budget(mode):
+    runner = HeadlessRunner(SCENES[mode], bot = BOTS[mode](), seed = 1)
+    start = time.perf_counter()
+    for _ in range(round(300.0 / runner.dt)):
+        if runner.scene.game_over:
+            runner.scene.reset()
+        runner.step()
+    assert time.perf_counter() - start < 2.0
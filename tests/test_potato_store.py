@@ -0,0 +1,34 @@
+import numpy as np
+import pygame
+from engine.potato_store import PotatoStore
+from engine.timestep import TICK_RATE
+
+def brute_hits(store, rect):
+    slots = store.live()
+    left, top, now = store.x[slots], store.y(slots, store.prev_clock), store.y(slots)
+    hit = (left < rect.right) & (left + store.w > rect.left) & (top < rect.bottom) & (now + store.h > rect.top)
+    return set(slots[hit].tolist())
+
+def check_hits(count, spawn, rows):
+    rng = np.random.default_rng(count)
+    store = PotatoStore(30, 23, capacity = 16)
+    store.add_many(rng.uniform(0, 600, count), rng.uniform(200, 700, count), rng.uniform(-60, 760, count))
+    for tick in range(1500):
+        store.step(rng.choice((1 / TICK_RATE, 1 / 30)))
+        store.add_many(rng.uniform(0, 600, spawn), rng.uniform(200, 700, spawn))
+        store.kill_below(800)
+        rect = pygame.Rect(int(rng.integers(-40, 600)), rows[tick // 500 % len(rows)], 45, 70)
+        expected = brute_hits(store, rect)
+        assert store.any_hit(rect) == bool(expected)
+        if tick % 3 == 0:
+            before = store.count
+            assert store.kill_hit(rect) == len(expected)
+            assert store.count == before - len(expected)
+            assert not store.alive[list(expected)].any()
+        assert store.count == len(store.live())
+
+def test_hit_tests_match_brute_force():
+    check_hits(30, 1, (665, 680))
+
+def test_hit_tests_match_brute_force_on_wide_band():
+    check_hits(3000, 40, (400, 665))
@@ -0,0 +1,24 @@
+import pytest
+from main import SCENES
+from engine.bots import BOTS
+from engine.input import ScriptedInput
+from engine.replay import Replay, ReplayRecorder, verify
+from engine.timestep import TICK_RATE
+
+@pytest.mark.parametrize("mode", ["dodge", "catch"])
+def test_replay_round_trip(mode):
+    inner = ScriptedInput()
+    recorder = ReplayRecorder(inner)
+    scene = SCENES[mode](600, 800, input_source = recorder, seed = 7)
+    recorder.begin(mode, scene.seed)
+    bot = BOTS[mode]()
+    for _ in range(20 * TICK_RATE):
+        if scene.game_over:
+            break
+        inner.set(bot(scene))
+        scene.update(1 / TICK_RATE)
+    replay = Replay.decode(recorder.finish(scene).encode())
+
+    ok, result = verify(replay)
+    assert ok
+    assert result["score"] == replay.score
@@ -0,0 +1,31 @@
+import os
+import json
+from engine.stats import StatsStore, read_history
+
+def test_abandoned_games_stay_out_of_the_top_index(tmp_path):
+    store = StatsStore(str(tmp_path), flush_interval = 0.01)
+    store.add("dodge", {"score": 99, "level": 3, "elapsed": 3.0}, seed = 1, finished = False)
+    store.add("dodge", {"score": 10, "level": 1, "elapsed": 30.0}, seed = 2)
+    assert [r.seed for r in store.top("dodge")] == [2]
+    store.close()
+
+    assert [r.seed for r in read_history(store.history_path)] == [1, 2]
+    reopened = StatsStore(str(tmp_path))
+    assert [r.seed for r in reopened.top("dodge")] == [2]
+    reopened.close()
+
+def test_old_index_is_rebuilt_without_abandoned_games(tmp_path):
+    store = StatsStore(str(tmp_path), flush_interval = 0.01)
+    store.add("catch", {"score": 50, "level": 2, "elapsed": 4.0}, seed = 1, finished = False)
+    store.close()
+    index_path = os.path.join(str(tmp_path), "top.json")
+    with open(index_path, encoding = "utf-8") as f:
+        index = json.load(f)
+    index["version"] = 1
+    index["top"]["catch"] = [[0.0, "catch", 50, 2, 4.0, 1, False]]
+    with open(index_path, "w", encoding = "utf-8") as f:
+        json.dump(index, f)
+
+    reopened = StatsStore(str(tmp_path))
+    assert reopened.top("catch") == []
+    reopened.close()